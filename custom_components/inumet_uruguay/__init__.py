@@ -1,22 +1,46 @@
 """The Inumet Uruguay integration."""
 from __future__ import annotations
+import logging
+import re
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .coordinator import InumetDataUpdateCoordinator
+from .const import (
+    DOMAIN,
+    NAME,
+    VERSION,
+    MANUFACTURER,
+    CONF_STATION_ID,
+    CONF_STATION_NAME,
+    CONF_STATIONS,
+)
+from .coordinator import InumetDataUpdateCoordinator, get_entry_title
+from .entity import station_device_identifier
+from .services import async_setup_services
 
-PLATFORMS: list[Platform] = [
-    Platform.BINARY_SENSOR,
-    Platform.SENSOR,
-    Platform.WEATHER,
-    Platform.IMAGE,
-    Platform.CAMERA,
-]
+_LOGGER = logging.getLogger(__package__)
+
+# Sufijos de unique_id de las entidades que pasan a ser por estación en la v2
+_STATION_UNIQUE_ID_SUFFIXES = (
+    "TempAire", "HumRelativa", "PresAtmMar", "IntViento", "DirViento", "weather", "camera",
+)
+
+# Títulos que arma la integración para más de una estación (ver get_entry_title)
+_GENERATED_TITLE_RE = re.compile(r"^\d+ estaciones$")
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 # ----------------------
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Inumet Uruguay services."""
+    async_setup_services(hass)
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Inumet Uruguay from a config entry."""
     coordinator = InumetDataUpdateCoordinator(hass, entry)
@@ -24,13 +48,96 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Antes de registrar el listener, para que cambiar las estaciones recargue una sola vez
+    _async_update_title(hass, entry, coordinator)
+    _async_sync_devices(hass, entry, coordinator)
+
+    # Solo se cargan las plataformas habilitadas en las opciones
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    coordinator: InumetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, coordinator.platforms):
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+@callback
+def _async_update_title(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: InumetDataUpdateCoordinator
+) -> None:
+    """Retitle the entry after its stations, unless the user renamed it."""
+    title = get_entry_title(coordinator.stations)
+    if entry.title == title:
+        return
+    # Solo se reemplazan títulos generados: "N estaciones" o el nombre de una estación
+    station_names = set(coordinator.stations.values())
+    if coordinator.data:
+        station_names.update(station.get("nombre") for station in coordinator.data["stations"].values())
+    if _GENERATED_TITLE_RE.match(entry.title) or entry.title in station_names:
+        hass.config_entries.async_update_entry(entry, title=title)
+
+@callback
+def _async_sync_devices(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: InumetDataUpdateCoordinator
+) -> None:
+    """Register the entry device and drop stations and platforms no longer used."""
+    device_registry = dr.async_get(hass)
+    device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=f"{NAME} - {entry.title}",
+        manufacturer=MANUFACTURER,
+        sw_version=VERSION,
+        model="Servicio Meteorológico",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
+    tracked = {station_device_identifier(entry, station_id) for station_id in coordinator.stations}
+    tracked.add((DOMAIN, entry.entry_id))
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        if not device.identifiers & tracked:
+            _LOGGER.debug("Eliminando dispositivo de estación no monitoreada: %s", device.name)
+            device_registry.async_remove_device(device.id)
+
+    # Las entidades de plataformas desactivadas en las opciones quedarían "no disponibles"
+    entity_registry = er.async_get(hass)
+    enabled_platforms = {str(platform) for platform in coordinator.platforms}
+    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if entity_entry.domain not in enabled_platforms:
+            _LOGGER.debug("Eliminando entidad de plataforma desactivada: %s", entity_entry.entity_id)
+            entity_registry.async_remove(entity_entry.entity_id)
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate old entries to the multi-station format."""
+    if entry.version > 2:
+        return False
+
+    if entry.version == 1:
+        data = dict(entry.data)
+        station_id = data.pop(CONF_STATION_ID)
+        station_name = data.pop(CONF_STATION_NAME, entry.title)
+        data[CONF_STATIONS] = [{CONF_STATION_ID: station_id, CONF_STATION_NAME: station_name}]
+
+        @callback
+        def _migrate_unique_id(entity_entry: er.RegistryEntry) -> dict[str, str] | None:
+            """Attach the station id to the entities that now live per station."""
+            for suffix in _STATION_UNIQUE_ID_SUFFIXES:
+                if entity_entry.unique_id == f"{entry.entry_id}_{suffix}":
+                    return {"new_unique_id": f"{entry.entry_id}_{station_id}_{suffix}"}
+            return None
+
+        await er.async_migrate_entries(hass, entry.entry_id, _migrate_unique_id)
+        hass.config_entries.async_update_entry(entry, data=data, version=2)
+        _LOGGER.debug("Entrada %s migrada a la versión 2", entry.entry_id)
+
+    return True
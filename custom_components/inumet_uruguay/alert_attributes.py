@@ -0,0 +1,75 @@
+"""Size-capped state attributes of the Inumet Uruguay alerts sensor."""
+from __future__ import annotations
+import json
+from typing import Any
+
+# Largo máximo del título en modo compacto
+SHORT_TITLE_LENGTH = 60
+
+# Campos de texto libre que se recortan (en este orden) antes de descartar una alerta
+TRUNCATED_FIELDS = ("instrucciones", "descripcion", "areas_afectadas")
+
+
+def compact_alert(alert: dict[str, Any]) -> dict[str, Any]:
+    """Reduce an alert to its identifying fields."""
+    title = alert.get("titulo") or ""
+    if len(title) > SHORT_TITLE_LENGTH:
+        title = f"{title[:SHORT_TITLE_LENGTH - 1]}…"
+    return {
+        "id": alert.get("id"),
+        "titulo": title,
+        "severidad": alert.get("severidad"),
+        "inicio": alert.get("inicio"),
+        "expira": alert.get("expira"),
+    }
+
+
+def json_size(value: Any) -> int:
+    """Return the size in bytes of a value serialized as compact JSON, like the recorder."""
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def truncate_alert(alert: dict[str, Any], max_size: int) -> dict[str, Any] | None:
+    """Shorten the free-text fields of an alert to fit in max_size, or None if impossible."""
+    alert = dict(alert)
+    for field in TRUNCATED_FIELDS:
+        if not isinstance(text := alert.get(field), str):
+            continue
+        encoded = text.encode()
+        while (overflow := json_size(alert) - max_size) > 0 and encoded:
+            # Se recorta en proporción al tamaño JSON del campo (los escapes
+            # ocupan más), sin partir caracteres UTF-8; "…" ocupa tres bytes
+            field_size = json_size(alert[field])
+            keep = max(field_size - overflow - 3, 0) * len(encoded) // field_size
+            text = encoded[: min(keep, len(encoded) - 1)].decode(errors="ignore")
+            encoded = text.encode()
+            alert[field] = f"{text}…" if text else ""
+    return alert if json_size(alert) <= max_size else None
+
+
+def cap_alerts(alerts: list[dict[str, Any]], max_size: int) -> list[dict[str, Any]]:
+    """Fit the alerts in the budget, shortening long texts before dropping alerts."""
+    # Tamaño de cada alerta más su coma; el presupuesto descuenta los corchetes
+    sizes = [json_size(alert) + 1 for alert in alerts]
+    budget = max_size - 2
+    if sum(sizes) <= budget:
+        return alerts
+
+    # Límite por alerta: las que entran quedan enteras y las más largas se
+    # reparten en partes iguales lo que sobra
+    limit = budget
+    remaining = len(sizes)
+    for size in sorted(sizes):
+        if size * remaining > budget:
+            limit = budget // remaining
+            break
+        budget -= size
+        remaining -= 1
+
+    capped = []
+    for alert, size in zip(alerts, sizes):
+        if size <= limit:
+            capped.append(alert)
+        elif (truncated := truncate_alert(alert, limit - 1)) is not None:
+            capped.append(truncated)
+    return capped
@@ -0,0 +1,176 @@
+"""Append-only on-disk archive of station observations for Inumet Uruguay."""
+from __future__ import annotations
+from collections.abc import Iterable
+import logging
+import mmap
+from pathlib import Path
+import re
+import struct
+import threading
+
+from .interpolation import observation_as_float
+
+_LOGGER = logging.getLogger(__package__)
+
+# Registro de tamaño fijo: segundos epoch UTC (int64) y valor (float64), little-endian
+RECORD = struct.Struct("<qd")
+
+# Los idStr de las variables se usan como nombre de archivo
+_SAFE_NAME = re.compile(r"^[\w-]+$")
+
+ArchiveKey = tuple[int, str]
+ArchivePoint = tuple[int, float]
+
+
+def collect_history(
+    estado: dict, station_ids: set[int], timestamps: list[int | None]
+) -> dict[ArchiveKey, list[ArchivePoint]]:
+    """Return the (timestamp, value) series of every tracked station and variable.
+
+    `timestamps` are the parsed 'fechas' of the snapshot; rows are aligned to
+    them from the end, since the last value of a row is the most recent one.
+    """
+    positions = {
+        position: station["id"]
+        for position, station in enumerate(estado.get("estaciones") or [])
+        if station.get("id") in station_ids
+    }
+    history: dict[ArchiveKey, list[ArchivePoint]] = {}
+    for variable, observacion in zip(estado.get("variables") or [], estado.get("observaciones") or []):
+        id_str = variable.get("idStr")
+        if not isinstance(id_str, str) or not _SAFE_NAME.match(id_str):
+            continue
+        datos = observacion.get("datos") or []
+        for position, station_id in positions.items():
+            row = datos[position] if position < len(datos) else None
+            if not isinstance(row, list) or not row:
+                continue
+            points = [
+                (timestamp, value)
+                for timestamp, raw in zip(timestamps[-len(row):], row[-len(timestamps):])
+                if timestamp is not None and (value := observation_as_float(raw)) is not None
+            ]
+            if points:
+                history[(station_id, id_str)] = points
+    return history
+
+
+class ObservationArchive:
+    """One append-only file of fixed-size records per station and variable.
+
+    Records are only appended with increasing timestamps, so each file is
+    sorted and range queries are a binary search over a memory map. All
+    methods do blocking I/O and must run in the executor; writes from
+    several entries are serialized by a lock.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the archive."""
+        self.root = root
+        # Último timestamp de cada archivo, para no releerlo en cada actualización
+        self._last_timestamps: dict[Path, int] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, station_id: int, variable_id_str: str) -> Path:
+        """Return the file of a station and variable."""
+        return self.root / str(station_id) / f"{variable_id_str}.bin"
+
+    def _last_timestamp(self, path: Path) -> int | None:
+        """Return the newest timestamp stored in a file, repairing a torn tail."""
+        if (cached := self._last_timestamps.get(path)) is not None:
+            return cached
+        if not path.exists():
+            return None
+        with path.open("r+b") as file:
+            size = file.seek(0, 2)
+            if size % RECORD.size:
+                # Un corte durante una escritura deja un registro incompleto al final
+                size -= size % RECORD.size
+                file.truncate(size)
+            if not size:
+                return None
+            file.seek(size - RECORD.size)
+            timestamp, _ = RECORD.unpack(file.read(RECORD.size))
+        self._last_timestamps[path] = timestamp
+        return timestamp
+
+    def append(self, station_id: int, variable_id_str: str, points: Iterable[ArchivePoint]) -> int:
+        """Append the points newer than the stored ones; return how many were written."""
+        path = self._path(station_id, variable_id_str)
+        with self._lock:
+            last = self._last_timestamp(path)
+
+            new_points = []
+            for timestamp, value in sorted(points):
+                if last is None or timestamp > last:
+                    new_points.append(RECORD.pack(timestamp, value))
+                    last = timestamp
+            if not new_points:
+                return 0
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with path.open("ab") as file:
+                    file.write(b"".join(new_points))
+            except BaseException:
+                # Una escritura parcial deja bytes sueltos: sin caché, el próximo
+                # append relee el archivo y trunca el registro incompleto
+                self._last_timestamps.pop(path, None)
+                raise
+            self._last_timestamps[path] = last
+            return len(new_points)
+
+    def append_history(self, history: dict[ArchiveKey, list[ArchivePoint]]) -> int:
+        """Append a snapshot's series for every station and variable."""
+        written = sum(
+            self.append(station_id, variable_id_str, points)
+            for (station_id, variable_id_str), points in history.items()
+        )
+        if written:
+            _LOGGER.debug("Archivadas %s observaciones nuevas", written)
+        return written
+
+    def query(
+        self, station_id: int, variable_id_str: str, start: int, end: int
+    ) -> list[ArchivePoint]:
+        """Return the points with start <= timestamp <= end, oldest first."""
+        path = self._path(station_id, variable_id_str)
+        if not path.exists():
+            return []
+
+        with path.open("rb") as file:
+            count = file.seek(0, 2) // RECORD.size
+            if not count:
+                return []
+            with mmap.mmap(file.fileno(), count * RECORD.size, access=mmap.ACCESS_READ) as data:
+
+                def timestamp_at(index: int) -> int:
+                    return RECORD.unpack_from(data, index * RECORD.size)[0]
+
+                # Primer registro con timestamp >= start
+                low, high = 0, count
+                while low < high:
+                    middle = (low + high) // 2
+                    if timestamp_at(middle) < start:
+                        low = middle + 1
+                    else:
+                        high = middle
+
+                points = []
+                for index in range(low, count):
+                    timestamp, value = RECORD.unpack_from(data, index * RECORD.size)
+                    if timestamp > end:
+                        break
+                    points.append((timestamp, value))
+                return points
+
+    def series(self) -> dict[int, list[str]]:
+        """Return the archived variables of every station."""
+        if not self.root.exists():
+            return {}
+        return {
+            int(station_dir.name): sorted(path.stem for path in station_dir.glob("*.bin"))
+            for station_dir in self.root.iterdir()
+            if station_dir.is_dir() and station_dir.name.lstrip("-").isdigit()
+        }
+
@@ -7,12 +7,20 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, NAME, VERSION, MANUFACTURER
+from .const import (
+    DOMAIN,
+    CONF_ALERT_ATTRIBUTES,
+    CONF_ALERT_ATTRIBUTES_MAX_SIZE,
+    ALERT_ATTRIBUTES_COMPACT,
+    DEFAULT_ALERT_ATTRIBUTES,
+    DEFAULT_ALERT_ATTRIBUTES_MAX_SIZE,
+    MAX_ALERT_ATTRIBUTES_MAX_SIZE,
+)
+from .alert_attributes import cap_alerts, compact_alert
 from .coordinator import InumetDataUpdateCoordinator
+from .entity import InumetEntity
 
 
 async def async_setup_entry(
@@ -23,25 +31,25 @@ async def async_setup_entry(
     async_add_entities([InumetAlertsBinarySensor(coordinator, entry)])
 
 
-class InumetAlertsBinarySensor(CoordinatorEntity[InumetDataUpdateCoordinator], BinarySensorEntity):
+class InumetAlertsBinarySensor(InumetEntity, BinarySensorEntity):
     """Inumet Alerts binary_sensor class."""
 
-    _attr_has_entity_name = True
     _attr_name = "Alerta"
     _attr_device_class = BinarySensorDeviceClass.SAFETY
+    _update_keys = ("alerts",)
 
     def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry) -> None:
         """Initialize the binary_sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_alerts"
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"{NAME} - {entry.data['station_name']}",
-            manufacturer=MANUFACTURER,
-            sw_version=VERSION,
-            model="Estación Meteorológica",
-            entry_type="service",
+        self._compact = (
+            entry.options.get(CONF_ALERT_ATTRIBUTES, DEFAULT_ALERT_ATTRIBUTES)
+            == ALERT_ATTRIBUTES_COMPACT
+        )
+        # Opciones guardadas antes de bajar el máximo permitido
+        self._max_size = min(
+            entry.options.get(CONF_ALERT_ATTRIBUTES_MAX_SIZE, DEFAULT_ALERT_ATTRIBUTES_MAX_SIZE),
+            MAX_ALERT_ATTRIBUTES_MAX_SIZE,
         )
 
     @property
@@ -55,27 +63,16 @@ class InumetAlertsBinarySensor(CoordinatorEntity[InumetDataUpdateCoordinator], B
         if not self.is_on:
             return None
 
-        alerts_list = []
-        alerts_data = self.coordinator.data.get("alerts")
-        if alerts_data:
-            for alert_feature in alerts_data.get("features", []):
-                properties = alert_feature.get("properties", {})
-                alert_info = {
-                    "id": properties.get("id"),
-                    "titulo": properties.get("event"),
-                    "severidad": properties.get("severity"),
-                    "certeza": properties.get("certainty"),
-                    "descripcion": properties.get("description"),
-                    "areas_afectadas": properties.get("areaDesc"),
-                    "inicio": properties.get("effective"),
-                    "expira": properties.get("expires"),
-                    "instrucciones": properties.get("instruction"),
-                }
-                alerts_list.append(alert_info)
+        # El texto completo de las alertas se obtiene con el servicio get_alerts o el diagnóstico
+        alerts_list = self.coordinator.get_alerts()
+        if self._compact:
+            alerts_list = [compact_alert(alert) for alert in alerts_list]
+        capped_alerts = cap_alerts(alerts_list, self._max_size)
 
         return {
             "cantidad_alertas": len(alerts_list),
-            "alertas": alerts_list,
+            "alertas": capped_alerts,
+            "alertas_omitidas": len(alerts_list) - len(capped_alerts),
             # --- LÍNEA CORREGIDA ---
             "ultima_actualizacion": self.coordinator.data.get("updated_at"),
         }
@@ -5,12 +5,11 @@ import logging
 from homeassistant.components.camera import Camera
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, NAME, VERSION, MANUFACTURER
+from .const import DOMAIN, CAMERA_URL_TEMPLATE
 from .coordinator import InumetDataUpdateCoordinator
+from .entity import InumetStationEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,44 +18,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     coordinator: InumetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     
     # Nos aseguramos de que los datos del coordinador estén listos antes de añadir la entidad
-    if coordinator.data and coordinator.data.get("estado"):
-        async_add_entities([InumetCamera(coordinator, entry)])
+    if coordinator.data and coordinator.data.get("stations"):
+        async_add_entities(
+            InumetCamera(coordinator, entry, station_id, station_name)
+            for station_id, station_name in coordinator.stations.items()
+        )
     else:
         _LOGGER.warning("No se pudo configurar la cámara de Inumet porque los datos iniciales no están disponibles.")
 
 
-class InumetCamera(CoordinatorEntity[InumetDataUpdateCoordinator], Camera):
+class InumetCamera(InumetStationEntity, Camera):
     """An Inumet camera entity that provides a stream URL as an attribute."""
 
-    _attr_has_entity_name = True
-    
-    def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry, station_id: int, station_name: str) -> None:
         """Initialize the camera."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry, station_id, station_name)
         Camera.__init__(self)
-        self.station_id = entry.data["station_id"]
         
         self._attr_name = "Cámara Estación"
-        self._attr_unique_id = f"{entry.entry_id}_camera"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"{NAME} ({entry.title})",
-            manufacturer=MANUFACTURER,
-            model="Estación Meteorológica",
-            sw_version=VERSION,
-        )
+        self._attr_unique_id = f"{entry.entry_id}_{station_id}_camera"
         self._url = None  # Se calculará en la primera actualización
 
     def _update_url(self) -> None:
         """Calculate and store the camera URL based on coordinator data."""
-        if not self.coordinator.data or not self.coordinator.data.get("estado"):
-            self._url = None
-            return
+        station_data = self.coordinator.get_station(self.station_id)
 
-        station_data = next((est for est in self.coordinator.data["estado"]["estaciones"] if est["id"] == self.station_id), None)
-        
         if station_data and (id_str := station_data.get("idStr")):
-            self._url = f"https://www.inumet.gub.uy/reportes/camaras_estaciones/{id_str}.webm"
+            self._url = self.coordinator.resolve_url(CAMERA_URL_TEMPLATE.format(id_str=id_str))
         else:
             self._url = None
 
@@ -6,6 +6,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession  # ✅ nuevo import
 
 # --- MODIFICACIÓN: Importar constantes para el formulario ---
@@ -15,40 +16,85 @@ from .const import (
     DEFAULT_UPDATE_INTERVAL,
     CONF_STATION_ID,
     CONF_STATION_NAME,
+    CONF_STATIONS,
     CONF_UPDATE_INTERVAL,
+    CONF_PLATFORMS,
+    CONF_ALERT_ATTRIBUTES,
+    CONF_ALERT_ATTRIBUTES_MAX_SIZE,
+    CONF_REPLAY_URL,
+    CONF_REPLAY_INTERVAL,
+    ALERT_ATTRIBUTES_COMPACT,
+    ALERT_ATTRIBUTES_FULL,
+    DEFAULT_ALERT_ATTRIBUTES,
+    DEFAULT_ALERT_ATTRIBUTES_MAX_SIZE,
+    MAX_ALERT_ATTRIBUTES_MAX_SIZE,
+    DEFAULT_REPLAY_INTERVAL,
 )
+from .coordinator import get_entry_platforms, get_entry_stations, get_entry_title
+from .streaming import CHUNK_SIZE, async_parse_estado
+
+PLATFORM_OPTIONS = {
+    "binary_sensor": "Sensor de alertas",
+    "sensor": "Sensores de estación e interpolados",
+    "weather": "Tiempo y pronóstico",
+    "image": "Mapas (alertas, FWI, UV)",
+    "camera": "Cámaras de estación",
+}
+
+
+def _station_options(estaciones: list[dict]) -> dict[str, str]:
+    """Build the sorted station selector options from the station list."""
+    # Las claves son str porque el selector múltiple viaja como JSON
+    station_options = {
+        str(station["id"]): station["nombre"]
+        for station in estaciones
+        if station.get("gerencia") == "INUMET"
+    }
+    return dict(sorted(station_options.items(), key=lambda item: item[1]))
+
+
+def _selected_stations(selected: list[str], station_options: dict[str, str]) -> list[dict[str, Any]]:
+    """Convert the selected station keys into the stored station list."""
+    return [
+        {
+            CONF_STATION_ID: int(station_key),
+            CONF_STATION_NAME: station_options.get(station_key, "Estación Desconocida"),
+        }
+        for station_key in selected
+    ]
 
 
 class InumetFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Inumet Uruguay."""
 
-    VERSION = 1
+    VERSION = 2
     _attr_translation_domain = DOMAIN
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self.station_options: dict[int, str] = {}
+        self.station_options: dict[str, str] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the user step."""
-        if len(self._async_current_entries()) >= 3:
-            return self.async_abort(reason="max_instances_reached")
-
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            station_id = user_input[CONF_STATION_ID]
-            station_name = self.station_options.get(station_id, "Estación Desconocida")
-
-            data_to_save = {
-                CONF_STATION_ID: station_id,
-                CONF_STATION_NAME: station_name,
-                CONF_UPDATE_INTERVAL: user_input[CONF_UPDATE_INTERVAL],
-            }
+            if not user_input[CONF_STATIONS]:
+                errors["base"] = "no_stations"
+            else:
+                stations = _selected_stations(user_input[CONF_STATIONS], self.station_options)
+
+                data_to_save = {
+                    CONF_STATIONS: stations,
+                    CONF_UPDATE_INTERVAL: user_input[CONF_UPDATE_INTERVAL],
+                }
 
-            return self.async_create_entry(title=station_name, data=data_to_save)
+                title = get_entry_title(
+                    {station[CONF_STATION_ID]: station[CONF_STATION_NAME] for station in stations}
+                )
+                return self.async_create_entry(title=title, data=data_to_save)
 
         # --- CAMBIO CLAVE: reemplazar httpx por aiohttp de Home Assistant ---
         try:
@@ -57,17 +103,13 @@ class InumetFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 if response.status != 200:
                     errors["base"] = "cannot_connect"
                 else:
-                    data = await response.json()
+                    # Solo hace falta la lista de estaciones, no las observaciones completas
+                    data = await async_parse_estado(
+                        response.content.iter_chunked(CHUNK_SIZE), set()
+                    )
 
             if not errors:
-                station_options = {
-                    station["id"]: station["nombre"]
-                    for station in data["estaciones"]
-                    if station.get("gerencia") == "INUMET"
-                }
-                self.station_options = dict(
-                    sorted(station_options.items(), key=lambda item: item[1])
-                )
+                self.station_options = _station_options(data["estaciones"])
 
         except Exception:
             errors["base"] = "cannot_connect"
@@ -77,7 +119,7 @@ class InumetFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_STATION_ID): vol.In(self.station_options),
+                vol.Required(CONF_STATIONS, default=[]): cv.multi_select(self.station_options),
                 vol.Required(
                     CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
                 ): vol.All(vol.Coerce(int), vol.Range(min=30, max=240)),
@@ -108,20 +150,79 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
-        if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+        errors: dict[str, str] = {}
+        current_stations = get_entry_stations(self.config_entry)
 
-        schema = vol.Schema(
-            {
-                vol.Required(
+        # Las estaciones disponibles salen del último snapshot del coordinador
+        station_options = {str(station_id): name for station_id, name in current_stations.items()}
+        if coordinator := self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id):
+            if coordinator.data and coordinator.data.get("stations"):
+                station_options = {
+                    **_station_options(list(coordinator.data["stations"].values())),
+                    **station_options,
+                }
+
+        if user_input is not None:
+            if not user_input[CONF_STATIONS]:
+                errors["base"] = "no_stations"
+            else:
+                # El título se actualiza al recargar la entrada (async_setup_entry)
+                stations = _selected_stations(user_input[CONF_STATIONS], station_options)
+                options = {**self.config_entry.options, **user_input, CONF_STATIONS: stations}
+                # Sin URL (vacía o sin modo avanzado) se vuelve a los servidores de Inumet
+                if not (user_input.get(CONF_REPLAY_URL) or "").strip():
+                    options.pop(CONF_REPLAY_URL, None)
+                    options.pop(CONF_REPLAY_INTERVAL, None)
+                return self.async_create_entry(title="", data=options)
+
+        schema = {
+            vol.Required(
+                CONF_STATIONS, default=[str(station_id) for station_id in current_stations]
+            ): cv.multi_select(station_options),
+            vol.Required(
+                CONF_UPDATE_INTERVAL,
+                default=self.config_entry.options.get(
                     CONF_UPDATE_INTERVAL,
-                    default=self.config_entry.options.get(
-                        CONF_UPDATE_INTERVAL,
-                        self.config_entry.data.get(
-                            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-                        ),
+                    self.config_entry.data.get(
+                        CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
                     ),
-                ): vol.All(vol.Coerce(int), vol.Range(min=30, max=240)),
-            }
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=30, max=240)),
+            vol.Required(
+                CONF_PLATFORMS,
+                default=[str(platform) for platform in get_entry_platforms(self.config_entry)],
+            ): cv.multi_select(PLATFORM_OPTIONS),
+            vol.Required(
+                CONF_ALERT_ATTRIBUTES,
+                default=self.config_entry.options.get(
+                    CONF_ALERT_ATTRIBUTES, DEFAULT_ALERT_ATTRIBUTES
+                ),
+            ): vol.In([ALERT_ATTRIBUTES_COMPACT, ALERT_ATTRIBUTES_FULL]),
+            vol.Required(
+                CONF_ALERT_ATTRIBUTES_MAX_SIZE,
+                default=self.config_entry.options.get(
+                    CONF_ALERT_ATTRIBUTES_MAX_SIZE, DEFAULT_ALERT_ATTRIBUTES_MAX_SIZE
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=256, max=MAX_ALERT_ATTRIBUTES_MAX_SIZE)),
+        }
+        if self.show_advanced_options:
+            # Modo replay: lee los datos de un servidor local (scripts/inumet_mock_server.py)
+            schema.update(
+                {
+                    vol.Optional(
+                        CONF_REPLAY_URL,
+                        description={
+                            "suggested_value": self.config_entry.options.get(CONF_REPLAY_URL)
+                        },
+                    ): str,
+                    vol.Required(
+                        CONF_REPLAY_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_REPLAY_INTERVAL, DEFAULT_REPLAY_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                }
+            )
+        return self.async_show_form(
+            step_id="init", data_schema=vol.Schema(schema), errors=errors
         )
-        return self.async_show_form(step_id="init", data_schema=schema)
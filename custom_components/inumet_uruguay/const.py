@@ -1,22 +1,62 @@
 """Constants for the Inumet Uruguay integration."""
 from datetime import timedelta
 
+from homeassistant.const import Platform
+
 DOMAIN = "inumet_uruguay"
 NAME = "Inumet Uruguay"
 MANUFACTURER = "matbott & 🤖"
 VERSION = "3.4.1"
 
+# Plataformas disponibles; el usuario elige cuáles cargar en las opciones
+PLATFORMS: list[Platform] = [
+    Platform.BINARY_SENSOR,
+    Platform.SENSOR,
+    Platform.WEATHER,
+    Platform.IMAGE,
+    Platform.CAMERA,
+]
+
 # URLs de la API
 ESTADO_ACTUAL_URL = "https://www.inumet.gub.uy/reportes/estadoActual/datos_inumet_ui_publica.mch"
 ALERTS_URL = "https://w2b.inumet.gub.uy/oapi/collections/urn:wmo:md:uy-inumet:cap-alerts/items?f=json"
 FORECAST_URL = "https://www.inumet.gub.uy/reportes/pronosticos/pronosticoV4.json"
 GENERAL_ALERTS_URL = "https://inumet.gub.uy/reportes/riesgo/advGral.mch" # <-- URL NUEVA
 ALERTS_CHECK_URL = "https://www.inumet.gub.uy/admin/check-avisos"
+UV_MAP_URL_TEMPLATE = "https://www.inumet.gub.uy/reportes/indice_uv/iuvcsk_{year}{day_of_year}_{time}.webp"
+FWI_MAP_URL_TEMPLATE = "https://www.inumet.gub.uy/reportes/fwi/FWI_{date}.png"
+CAMERA_URL_TEMPLATE = "https://www.inumet.gub.uy/reportes/camaras_estaciones/{id_str}.webm"
+
+# Zona horaria de las fechas sin offset que publica Inumet
+INUMET_TIME_ZONE = "America/Montevideo"
+
+# Variables (idStr) con un sensor por estación
+STATION_SENSOR_VARIABLES = ("TempAire", "HumRelativa", "PresAtmMar", "IntViento", "DirViento")
+
+# Variables que se pueden interpolar entre estaciones (la dirección del viento es circular)
+INTERPOLATED_VARIABLES = ("TempAire", "HumRelativa", "PresAtmMar", "IntViento")
 
 # Intervalo de actualización
 DEFAULT_UPDATE_INTERVAL = 30
+# Intervalo (en segundos) del modo replay contra el servidor local de pruebas
+DEFAULT_REPLAY_INTERVAL = 30
 
 # Constantes para la configuración
 CONF_STATION_ID = "station_id"
 CONF_STATION_NAME = "station_name"
+CONF_STATIONS = "stations"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_PLATFORMS = "platforms"
+CONF_REPLAY_URL = "replay_url"
+CONF_REPLAY_INTERVAL = "replay_interval"
+CONF_ALERT_ATTRIBUTES = "alert_attributes"
+CONF_ALERT_ATTRIBUTES_MAX_SIZE = "alert_attributes_max_size"
+
+# Modos de atributos del sensor de alertas
+ALERT_ATTRIBUTES_COMPACT = "compact"
+ALERT_ATTRIBUTES_FULL = "full"
+DEFAULT_ALERT_ATTRIBUTES = ALERT_ATTRIBUTES_COMPACT
+# Tamaño máximo (en bytes JSON) de la lista de alertas en los atributos; el recorder descarta más de 16 KiB
+DEFAULT_ALERT_ATTRIBUTES_MAX_SIZE = 4096
+# Deja lugar para los demás atributos del sensor dentro de esos 16 KiB
+MAX_ALERT_ATTRIBUTES_MAX_SIZE = 12288
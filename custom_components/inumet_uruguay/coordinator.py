@@ -2,10 +2,15 @@
 from __future__ import annotations
 import logging
 import asyncio
-from datetime import timedelta
+from datetime import timedelta, tzinfo
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -13,16 +18,141 @@ import aiohttp
 
 from .const import (
     DOMAIN,
+    PLATFORMS,
     ALERTS_URL,
     FORECAST_URL,
     ESTADO_ACTUAL_URL,
     GENERAL_ALERTS_URL,
     ALERTS_CHECK_URL,
+    UV_MAP_URL_TEMPLATE,
+    FWI_MAP_URL_TEMPLATE,
+    INUMET_TIME_ZONE,
+    INTERPOLATED_VARIABLES,
+    STATION_SENSOR_VARIABLES,
     NAME,
+    CONF_STATIONS,
+    CONF_STATION_ID,
+    CONF_STATION_NAME,
+    CONF_UPDATE_INTERVAL,
+    CONF_PLATFORMS,
+    CONF_REPLAY_URL,
+    CONF_REPLAY_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_REPLAY_INTERVAL,
 )
+from .archive import ObservationArchive, collect_history
+from .interpolation import StationInterpolator
+from .streaming import CHUNK_SIZE, async_parse_estado
 
 _LOGGER = logging.getLogger(__package__)
 
+# Fuentes de datos que se descargan solo si alguna entidad habilitada las usa
+SOURCE_ESTADO = "estado"
+SOURCE_FORECAST = "forecast"
+SOURCE_ALERTS = "alerts"
+SOURCE_ADV_GRAL = "adv_gral"
+SOURCE_UV = "uv"
+
+
+def get_entry_stations(entry: ConfigEntry) -> dict[int, str]:
+    """Return the stations tracked by an entry as a {station_id: name} map."""
+    stations = entry.options.get(CONF_STATIONS, entry.data.get(CONF_STATIONS, []))
+    return {
+        station[CONF_STATION_ID]: station.get(CONF_STATION_NAME, str(station[CONF_STATION_ID]))
+        for station in stations
+    }
+
+
+def get_entry_title(stations: dict[int, str]) -> str:
+    """Return the entry title for a {station_id: name} set of stations."""
+    if len(stations) == 1:
+        return next(iter(stations.values()))
+    return f"{len(stations)} estaciones"
+
+
+def get_entry_platforms(entry: ConfigEntry) -> list[Platform]:
+    """Return the platforms enabled for an entry."""
+    enabled = entry.options.get(CONF_PLATFORMS, PLATFORMS)
+    return [platform for platform in PLATFORMS if platform in enabled]
+
+
+def _index_estado(estado: dict | None) -> tuple[dict[int, dict], dict[int, dict[str, Any]]]:
+    """Index the national snapshot by station in a single pass.
+
+    Returns the station metadata and the latest value of every variable,
+    both keyed by station id, so entities never scan the raw lists.
+    """
+    if not estado:
+        return {}, {}
+
+    estaciones = estado.get("estaciones") or []
+    station_ids = [est.get("id") for est in estaciones]
+    stations = {est["id"]: est for est in estaciones if est.get("id") is not None}
+    observations: dict[int, dict[str, Any]] = {station_id: {} for station_id in stations}
+
+    # 'observaciones' está alineado con 'variables' y cada 'datos' con 'estaciones'
+    for variable, observacion in zip(estado.get("variables") or [], estado.get("observaciones") or []):
+        id_str = variable.get("idStr")
+        for station_id, row in zip(station_ids, observacion.get("datos") or []):
+            if row and station_id in observations:
+                # El último dato es el más reciente
+                observations[station_id][id_str] = row[-1]
+
+    return stations, observations
+
+
+def station_update_key(station_id: int) -> str:
+    """Return the change key of a station's observations and metadata."""
+    return f"station_{station_id}"
+
+
+def _changed_keys(old: dict | None, new: dict) -> set[str] | None:
+    """Return the snapshot keys that differ between two refreshes.
+
+    None means everything must be considered changed (first refresh).
+    """
+    if not old:
+        return None
+
+    changed = {
+        key
+        for key, fields in (
+            ("forecast", ("forecast",)),
+            ("alerts", ("has_alerts", "alerts")),
+            ("adv_gral", ("adv_gral",)),
+            ("latest_uv_url", ("latest_uv_url",)),
+            ("fwi_url", ("fwi_url",)),
+            ("observations", ("observations",)),
+        )
+        if any(old.get(field) != new.get(field) for field in fields)
+    }
+    for station_id in new["observations"].keys() | old["observations"].keys():
+        if (
+            old["observations"].get(station_id) != new["observations"].get(station_id)
+            or old["stations"].get(station_id) != new["stations"].get(station_id)
+        ):
+            changed.add(station_update_key(station_id))
+    return changed
+
+
+def _parse_fecha(fecha: Any, time_zone: tzinfo) -> int | None:
+    """Parse an estadoActual date into epoch seconds (naive dates are in `time_zone`)."""
+    if not isinstance(fecha, str) or not (parsed := dt_util.parse_datetime(fecha)):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=time_zone)
+    return int(dt_util.as_utc(parsed).timestamp())
+
+
+def _index_forecast(forecast: dict | None) -> dict[int, dict[int, dict]]:
+    """Index forecast items by zone and day offset."""
+    zones: dict[int, dict[int, dict]] = {}
+    if not forecast:
+        return zones
+    for item in forecast.get("items", []):
+        zones.setdefault(item.get("zonaId"), {})[item.get("diaMasN", 0)] = item
+    return zones
+
 class InumetDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from Inumet API."""
 
@@ -31,18 +161,42 @@ class InumetDataUpdateCoordinator(DataUpdateCoordinator):
         self.hass = hass
         self.config_entry = entry
         self.session = async_get_clientsession(hass)
-        update_interval_minutes = entry.options.get("update_interval", 30)
+        self.stations = get_entry_stations(entry)
+        self.platforms = get_entry_platforms(entry)
+        self.interpolator = StationInterpolator()
+        self.changed_keys: set[str] | None = None
+        # Una única instancia para todas las entradas: los archivos son por estación y variable
+        self.archive: ObservationArchive = hass.data.setdefault(
+            f"{DOMAIN}_archive",
+            ObservationArchive(Path(hass.config.path(".storage", f"{DOMAIN}_archive"))),
+        )
+        update_interval_minutes = entry.options.get(
+            CONF_UPDATE_INTERVAL, entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        )
         update_interval = timedelta(minutes=update_interval_minutes)
+        # En modo replay las URLs apuntan al servidor local y se admite un intervalo en segundos
+        self.replay_url: str | None = (entry.options.get(CONF_REPLAY_URL) or "").rstrip("/") or None
+        if self.replay_url:
+            update_interval = timedelta(
+                seconds=entry.options.get(CONF_REPLAY_INTERVAL, DEFAULT_REPLAY_INTERVAL)
+            )
+            _LOGGER.warning("Modo replay activo: los datos de Inumet se leen de %s", self.replay_url)
         super().__init__(
             hass, _LOGGER, name=f"{NAME} ({entry.title})", update_interval=update_interval
         )
 
+    @staticmethod
+    def _with_cache_buster(url: str) -> str:
+        """Append a cache buster to the endpoints served through a cache."""
+        if "check-avisos" in url or "inumet.gub.uy/reportes" in url:
+            cache_buster = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+            return f"{url}?{cache_buster}"
+        return url
+
     async def _fetch_data(self, url: str) -> dict | None:
         """Generic data fetcher."""
         try:
-            if "check-avisos" in url or "inumet.gub.uy/reportes" in url:
-                cache_buster = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
-                url = f"{url}?{cache_buster}"
+            url = self._with_cache_buster(url)
 
             async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=20)) as response:
                 if response.status != 200:
@@ -57,6 +211,26 @@ class InumetDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.warning(f"Error al obtener o procesar datos de {url}: {e}")
             return None
 
+    async def _fetch_estado(self) -> dict | None:
+        """Fetch estadoActual, parsing it incrementally as the body arrives.
+
+        Only the station list, the variables and the rows of the configured
+        stations are kept whole, so memory does not grow with the network.
+        """
+        url = self._with_cache_buster(self.resolve_url(ESTADO_ACTUAL_URL))
+        try:
+            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=20)) as response:
+                if response.status != 200:
+                    _LOGGER.warning("Error HTTP %s al obtener %s", response.status, url)
+                    return None
+                return await async_parse_estado(
+                    response.content.iter_chunked(CHUNK_SIZE), set(self.stations)
+                )
+
+        except Exception as e:
+            _LOGGER.warning(f"Error al obtener o procesar datos de {url}: {e}")
+            return None
+
     async def _async_find_latest_uv_url(self) -> str | None:
         """Find the latest available UV map URL by searching backwards in time."""
         now_utc = dt_util.utcnow()
@@ -66,9 +240,8 @@ class InumetDataUpdateCoordinator(DataUpdateCoordinator):
             time_str = f"{check_time.hour:02d}{rounded_minute:02d}"
             year_str = check_time.strftime("%Y")
             day_of_year_str = check_time.strftime("%j")
-            url_to_check = (
-                f"https://www.inumet.gub.uy/reportes/indice_uv/"
-                f"iuvcsk_{year_str}{day_of_year_str}_{time_str}.webp"
+            url_to_check = self.resolve_url(
+                UV_MAP_URL_TEMPLATE.format(year=year_str, day_of_year=day_of_year_str, time=time_str)
             )
             try:
                 async with self.session.head(url_to_check, timeout=aiohttp.ClientTimeout(total=5)) as response:
@@ -80,46 +253,187 @@ class InumetDataUpdateCoordinator(DataUpdateCoordinator):
         _LOGGER.warning("No se pudo encontrar una URL válida para el mapa UV.")
         return None
 
+    def _enabled_sources(self) -> set[str]:
+        """Return the data sources with at least one enabled consumer entity."""
+        registry = er.async_get(self.hass)
+        entry_id = self.config_entry.entry_id
+
+        def _enabled(platform: Platform, unique_id: str) -> bool:
+            """Return whether an entity is loaded and not disabled by the user."""
+            if platform not in self.platforms:
+                return False
+            entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id)
+            return entity_id is None or not registry.async_get(entity_id).disabled
+
+        # estadoActual alimenta los sensores por estación, los interpolados, el
+        # tiempo y las cámaras; sin ninguno de ellos tampoco se archiva ni interpola
+        estado_consumers = [
+            (Platform.SENSOR, f"{entry_id}_interpolated_{variable}") for variable in INTERPOLATED_VARIABLES
+        ]
+        for station_id in self.stations:
+            estado_consumers.extend(
+                (Platform.SENSOR, f"{entry_id}_{station_id}_{variable}") for variable in STATION_SENSOR_VARIABLES
+            )
+            estado_consumers.append((Platform.WEATHER, f"{entry_id}_{station_id}_weather"))
+            estado_consumers.append((Platform.CAMERA, f"{entry_id}_{station_id}_camera"))
+
+        sources = set()
+        if any(_enabled(platform, unique_id) for platform, unique_id in estado_consumers):
+            sources.add(SOURCE_ESTADO)
+        if any(_enabled(Platform.WEATHER, f"{entry_id}_{station_id}_weather") for station_id in self.stations):
+            sources.add(SOURCE_FORECAST)
+        if _enabled(Platform.BINARY_SENSOR, f"{entry_id}_alerts"):
+            sources.add(SOURCE_ALERTS)
+        if _enabled(Platform.IMAGE, f"{entry_id}_alert_map"):
+            sources.add(SOURCE_ADV_GRAL)
+        if _enabled(Platform.IMAGE, f"{entry_id}_uv_map"):
+            sources.add(SOURCE_UV)
+        return sources
+
     async def _async_update_data(self) -> dict:
         """Fetch all data from API endpoints robustly."""
         _LOGGER.debug("Iniciando actualización de datos de Inumet")
 
-        alert_check_json = await self._fetch_data(ALERTS_CHECK_URL)
-        has_alerts = alert_check_json.get("has_avisos", False) if alert_check_json else False
+        sources = self._enabled_sources()
+        _LOGGER.debug("Fuentes de datos habilitadas: %s", sorted(sources))
+
+        has_alerts = False
+        if sources & {SOURCE_ALERTS, SOURCE_ADV_GRAL}:
+            alert_check_json = await self._fetch_data(self.resolve_url(ALERTS_CHECK_URL))
+            has_alerts = alert_check_json.get("has_avisos", False) if alert_check_json else False
 
-        estado_data = await self._fetch_data(ESTADO_ACTUAL_URL)
-        forecast_data = await self._fetch_data(FORECAST_URL)
-        latest_uv_url = await self._async_find_latest_uv_url()
+        estado_data = await self._fetch_estado() if SOURCE_ESTADO in sources else None
+        forecast_data = await self._fetch_data(self.resolve_url(FORECAST_URL)) if SOURCE_FORECAST in sources else None
+        latest_uv_url = await self._async_find_latest_uv_url() if SOURCE_UV in sources else None
 
         alerts_data = {}
         adv_gral_data = {}
         if has_alerts:
             _LOGGER.debug("Aviso detectado, buscando detalles...")
-            alert_details_results = await asyncio.gather(
-                self._fetch_data(ALERTS_URL),
-                self._fetch_data(GENERAL_ALERTS_URL),
-                return_exceptions=True,
-            )
-            alerts_data = (
-                alert_details_results[0]
-                if not isinstance(alert_details_results[0], Exception)
-                else {}
-            )
-            adv_gral_data = (
-                alert_details_results[1]
-                if not isinstance(alert_details_results[1], Exception)
-                else {}
+            detail_fetches = {
+                source: self._fetch_data(self.resolve_url(url))
+                for source, url in ((SOURCE_ALERTS, ALERTS_URL), (SOURCE_ADV_GRAL, GENERAL_ALERTS_URL))
+                if source in sources
+            }
+            alert_details_results = dict(
+                zip(
+                    detail_fetches,
+                    await asyncio.gather(*detail_fetches.values(), return_exceptions=True),
+                )
             )
+            alerts_data = alert_details_results.get(SOURCE_ALERTS, {})
+            if isinstance(alerts_data, Exception):
+                alerts_data = {}
+            adv_gral_data = alert_details_results.get(SOURCE_ADV_GRAL, {})
+            if isinstance(adv_gral_data, Exception):
+                adv_gral_data = {}
 
-        if not estado_data and not forecast_data:
+        essential_data = [
+            data
+            for source, data in ((SOURCE_ESTADO, estado_data), (SOURCE_FORECAST, forecast_data))
+            if source in sources
+        ]
+        if essential_data and not any(essential_data):
             raise UpdateFailed("No se pudieron obtener los datos esenciales de Inumet.")
 
-        return {
-            "estado": estado_data,
+        if estado_data:
+            await self._async_archive(estado_data)
+
+        stations, observations = _index_estado(estado_data)
+        if stations:
+            self.interpolator.update_geometry(stations)
+
+        data = {
+            "stations": stations,
+            "observations": observations,
             "forecast": forecast_data,
+            "forecast_zones": _index_forecast(forecast_data),
             "alerts": alerts_data,
             "adv_gral": adv_gral_data,
             "latest_uv_url": latest_uv_url,
             "has_alerts": has_alerts,
             "last_updated_timestamp": dt_util.utcnow(),
+            "fwi_url": self.resolve_url(
+                FWI_MAP_URL_TEMPLATE.format(date=dt_util.now().strftime("%Y_%m_%d"))
+            ),
         }
+        # Se calcula antes de publicar el snapshot, mientras self.data sigue siendo el anterior
+        self.changed_keys = _changed_keys(self.data, data)
+        return data
+
+    async def _async_archive(self, estado_data: dict) -> None:
+        """Append the new observations of the tracked stations to the archive."""
+        # Las fechas son hora de Uruguay, sea cual sea la zona horaria de Home Assistant
+        time_zone = dt_util.get_time_zone(INUMET_TIME_ZONE)
+        timestamps = [_parse_fecha(fecha, time_zone) for fecha in estado_data.get("fechas") or []]
+        if not any(timestamps):
+            _LOGGER.debug("estadoActual sin 'fechas' válidas, no se archivan observaciones")
+            return
+        history = collect_history(estado_data, set(self.stations), timestamps)
+        try:
+            await self.hass.async_add_executor_job(self.archive.append_history, history)
+        except OSError as e:
+            _LOGGER.warning(f"Error al escribir el archivo histórico de observaciones: {e}")
+
+    def resolve_url(self, url: str) -> str:
+        """Return the URL to request, redirected to the replay server in replay mode."""
+        if not self.replay_url:
+            return url
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self.replay_url}{parts.path}{query}"
+
+    def has_changed(self, keys: tuple[str, ...]) -> bool:
+        """Return whether any of the given snapshot keys changed in the last refresh."""
+        if self.changed_keys is None:
+            return True
+        return any(key in self.changed_keys for key in keys)
+
+    def get_station(self, station_id: int) -> dict | None:
+        """Return the metadata of a station from the latest snapshot."""
+        if not self.data:
+            return None
+        return self.data["stations"].get(station_id)
+
+    def get_observation(self, station_id: int, variable_id_str: str) -> Any:
+        """Return the latest observed value of a variable at a station."""
+        if not self.data:
+            return None
+        return self.data["observations"].get(station_id, {}).get(variable_id_str)
+
+    def get_forecast_item(self, zone_id: int, day_offset: int) -> dict | None:
+        """Return the forecast item of a zone for a given day offset."""
+        if not self.data:
+            return None
+        return self.data["forecast_zones"].get(zone_id, {}).get(day_offset)
+
+    def interpolate(self, latitude: float, longitude: float, variable_id_str: str) -> float | None:
+        """Interpolate a variable to an arbitrary point from every station."""
+        if not self.data:
+            return None
+        return self.interpolator.interpolate(
+            latitude, longitude, variable_id_str, self.data["observations"]
+        )
+
+    def get_alerts(self) -> list[dict[str, Any]]:
+        """Return the full details of the active CAP alerts."""
+        if not self.data or not (alerts_data := self.data.get("alerts")):
+            return []
+
+        alerts_list = []
+        for alert_feature in alerts_data.get("features", []):
+            properties = alert_feature.get("properties", {})
+            alerts_list.append(
+                {
+                    "id": properties.get("id"),
+                    "titulo": properties.get("event"),
+                    "severidad": properties.get("severity"),
+                    "certeza": properties.get("certainty"),
+                    "descripcion": properties.get("description"),
+                    "areas_afectadas": properties.get("areaDesc"),
+                    "inicio": properties.get("effective"),
+                    "expira": properties.get("expires"),
+                    "instrucciones": properties.get("instruction"),
+                }
+            )
+        return alerts_list
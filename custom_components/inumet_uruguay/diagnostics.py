@@ -0,0 +1,36 @@
+"""Diagnostics support for Inumet Uruguay."""
+from __future__ import annotations
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import InumetDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry, including the full alert bodies."""
+    coordinator: InumetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "version": entry.version,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "last_update_success": coordinator.last_update_success,
+        "last_updated": data.get("last_updated_timestamp"),
+        "stations": {
+            station_id: coordinator.get_station(station_id) for station_id in coordinator.stations
+        },
+        "has_alerts": data.get("has_alerts", False),
+        "alerts": coordinator.get_alerts(),
+        "adv_gral": data.get("adv_gral"),
+        "latest_uv_url": data.get("latest_uv_url"),
+        "archived_series": await hass.async_add_executor_job(coordinator.archive.series),
+    }
@@ -0,0 +1,87 @@
+"""Base entities for Inumet Uruguay."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, NAME, VERSION, MANUFACTURER
+from .coordinator import InumetDataUpdateCoordinator, station_update_key
+
+
+def station_device_identifier(entry: ConfigEntry, station_id: int) -> tuple[str, str]:
+    """Return the device identifier of a station tracked by an entry."""
+    return (DOMAIN, f"{entry.entry_id}_{station_id}")
+
+
+class InumetCoordinatorEntity(CoordinatorEntity[InumetDataUpdateCoordinator]):
+    """Coordinator entity that only writes its state when its data changed."""
+
+    _attr_has_entity_name = True
+    # Claves del snapshot del coordinador de las que depende el estado de la entidad
+    _update_keys: tuple[str, ...] = ()
+
+    def __init__(self, coordinator: InumetDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._written_success = coordinator.last_update_success
+
+    @property
+    def update_keys(self) -> tuple[str, ...]:
+        """Return the snapshot keys this entity depends on."""
+        return self._update_keys
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if availability or the entity's data changed."""
+        success = self.coordinator.last_update_success
+        if success == self._written_success and not self.coordinator.has_changed(self.update_keys):
+            return
+        self._written_success = success
+        super()._handle_coordinator_update()
+
+
+class InumetEntity(InumetCoordinatorEntity):
+    """Entity fed by national data (alerts, maps), grouped in the entry device."""
+
+    def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"{NAME} - {entry.title}",
+            manufacturer=MANUFACTURER,
+            sw_version=VERSION,
+            model="Servicio Meteorológico",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+
+class InumetStationEntity(InumetCoordinatorEntity):
+    """Entity fed by the observations of a single station."""
+
+    def __init__(
+        self,
+        coordinator: InumetDataUpdateCoordinator,
+        entry: ConfigEntry,
+        station_id: int,
+        station_name: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.station_id = station_id
+        self._attr_device_info = DeviceInfo(
+            identifiers={station_device_identifier(entry, station_id)},
+            name=f"{NAME} - {station_name}",
+            manufacturer=MANUFACTURER,
+            sw_version=VERSION,
+            model="Estación Meteorológica",
+            via_device=(DOMAIN, entry.entry_id),
+        )
+
+    @property
+    def update_keys(self) -> tuple[str, ...]:
+        """Return the snapshot keys this entity depends on, including its station."""
+        return (station_update_key(self.station_id), *self._update_keys)
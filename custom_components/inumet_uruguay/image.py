@@ -8,13 +8,12 @@ from datetime import datetime
 from homeassistant.components.image import ImageEntity, ImageEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, NAME, VERSION, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import InumetDataUpdateCoordinator
+from .entity import InumetEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,12 +32,11 @@ def _get_alert_map_url(data: dict | None) -> str | None:
 
     return base_url
 
-def _get_fwi_url_data() -> tuple[str, datetime]:
-    """Generate URL and updated time for the FWI map."""
-    now = dt_util.now()
-    date_str = now.strftime('%Y_%m_%d')
-    url = f"https://www.inumet.gub.uy/reportes/fwi/FWI_{date_str}.png"
-    return url, dt_util.start_of_local_day(now)
+def _get_fwi_url_data(data: dict | None) -> tuple[str | None, datetime]:
+    """Get URL and updated time for the FWI map."""
+    # La URL del día la arma el coordinador (apunta al servidor local en modo replay)
+    url = data.get("fwi_url") if data else None
+    return url, dt_util.start_of_local_day(dt_util.now())
 
 def _get_uv_url_data(data: dict | None) -> tuple[str | None, datetime | None]:
     """Get URL and updated time for the UV map."""
@@ -66,6 +64,7 @@ class InumetImageEntityDescription(ImageEntityDescription):
     icon: str
     url_fn: Callable[[dict | None], str | None] | None = None
     last_updated_fn: Callable[[dict | None], datetime | None] | None = None
+    update_keys: tuple[str, ...] = ()
 
 
 IMAGE_DESCRIPTIONS: tuple[InumetImageEntityDescription, ...] = (
@@ -73,11 +72,13 @@ IMAGE_DESCRIPTIONS: tuple[InumetImageEntityDescription, ...] = (
         key="alert_map", name="Mapa de Alertas", icon="mdi:alert-outline",
         url_fn=_get_alert_map_url,
         last_updated_fn=lambda data: dt_util.parse_datetime(data.get("adv_gral", {}).get("fechaActualizacion")) if data and data.get("adv_gral", {}).get("fechaActualizacion") else None,
+        update_keys=("adv_gral",),
     ),
     InumetImageEntityDescription(
         key="fwi_map", name="Mapa de Peligro de Incendio (FWI)", icon="mdi:fire",
-        url_fn=lambda data: _get_fwi_url_data()[0],
-        last_updated_fn=lambda data: _get_fwi_url_data()[1],
+        url_fn=lambda data: _get_fwi_url_data(data)[0],
+        last_updated_fn=lambda data: _get_fwi_url_data(data)[1],
+        update_keys=("fwi_url",),
     ),
     # --- INICIO DE LA CORRECCIÓN ---
     InumetImageEntityDescription(
@@ -85,6 +86,7 @@ IMAGE_DESCRIPTIONS: tuple[InumetImageEntityDescription, ...] = (
         # Le volvemos a añadir el [0] para que tome solo la URL del resultado
         url_fn=lambda data: _get_uv_url_data(data)[0],
         last_updated_fn=lambda data: _get_uv_url_data(data)[1],
+        update_keys=("latest_uv_url",),
     ),
     # --- FIN DE LA CORRECCIÓN ---
 )
@@ -96,27 +98,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         InumetImage(hass, coordinator, entry, description) for description in IMAGE_DESCRIPTIONS
     )
 
-class InumetImage(CoordinatorEntity[InumetDataUpdateCoordinator], ImageEntity):
+class InumetImage(InumetEntity, ImageEntity):
     """Inumet Image Entity."""
     entity_description: InumetImageEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(self, hass: HomeAssistant, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry, description: InumetImageEntityDescription) -> None:
         """Initialize the image entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry)
         ImageEntity.__init__(self, hass) 
         
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_name = description.name
         self._attr_icon = description.icon
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"{NAME} ({entry.title})",
-            manufacturer=MANUFACTURER,
-            sw_version=VERSION,
-            model="Estación Meteorológica",
-        )
+        self._update_keys = description.update_keys
     
     @property
     def device_class(self) -> str | None:
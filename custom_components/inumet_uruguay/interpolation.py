@@ -0,0 +1,130 @@
+"""Inverse-distance interpolation of station observations for Inumet Uruguay."""
+from __future__ import annotations
+import math
+from typing import Any
+
+EARTH_RADIUS_KM = 6371.0
+DEFAULT_POWER = 2.0
+DEFAULT_NEIGHBORS = 8
+
+# Por debajo de esta distancia el punto se considera sobre la estación
+_SAME_POINT_KM = 0.05
+
+# Puntos cuyos pesos se conservan (sensores y llamadas al servicio)
+_MAX_CACHED_POINTS = 64
+
+_LAT_KEYS = ("latitud", "lat", "latitude")
+_LON_KEYS = ("longitud", "lon", "longitude")
+
+
+def station_coordinates(station: dict) -> tuple[float, float] | None:
+    """Return the (lat, lon) of a station, or None if it has no usable position."""
+    lat = next((station[key] for key in _LAT_KEYS if station.get(key) is not None), None)
+    lon = next((station[key] for key in _LON_KEYS if station.get(key) is not None), None)
+    try:
+        return float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+
+
+def _distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance between two points."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def observation_as_float(value: Any) -> float | None:
+    """Convert an observation to float, ignoring non-numeric markers."""
+    if value == "TRAZA":
+        return 0.0
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(result) else result
+
+
+class StationInterpolator:
+    """Inverse-distance weighting over the national station network.
+
+    The station geometry is kept between refreshes and the weights of each
+    point are computed once, so a refresh only re-weights the new values.
+    """
+
+    def __init__(self, power: float = DEFAULT_POWER, neighbors: int = DEFAULT_NEIGHBORS) -> None:
+        """Initialize the interpolator."""
+        self.power = power
+        self.neighbors = neighbors
+        self._geometry: tuple[tuple[int, float, float], ...] = ()
+        self._weights: dict[tuple[float, float], tuple[tuple[int, float], ...]] = {}
+
+    def update_geometry(self, stations: dict[int, dict]) -> None:
+        """Refresh the station positions, dropping cached weights if they moved."""
+        geometry = tuple(
+            (station_id, *coords)
+            for station_id, station in stations.items()
+            if (coords := station_coordinates(station)) is not None
+        )
+        if geometry != self._geometry:
+            self._geometry = geometry
+            self._weights.clear()
+
+    def weights(self, latitude: float, longitude: float) -> tuple[tuple[int, float], ...]:
+        """Return the (station_id, weight) pairs of every station, nearest first."""
+        # ~100 m de resolución para que la caché no crezca con ruido de coordenadas
+        key = (round(latitude, 3), round(longitude, 3))
+        if (cached := self._weights.get(key)) is not None:
+            return cached
+
+        # Se guarda la lista completa: qué estaciones reportan depende de la variable
+        distances = sorted(
+            (_distance_km(latitude, longitude, lat, lon), station_id)
+            for station_id, lat, lon in self._geometry
+        )
+
+        # Las estaciones sobre el punto (puede haber varias en el mismo lugar)
+        # tienen peso infinito; si ninguna reporta se usan las demás
+        weights = tuple(
+            (station_id, math.inf if distance < _SAME_POINT_KM else 1 / distance**self.power)
+            for distance, station_id in distances
+        )
+
+        if len(self._weights) >= _MAX_CACHED_POINTS:
+            # Se descarta el punto más antiguo
+            del self._weights[next(iter(self._weights))]
+        self._weights[key] = weights
+        return weights
+
+    def interpolate(
+        self,
+        latitude: float,
+        longitude: float,
+        variable_id_str: str,
+        observations: dict[int, dict[str, Any]],
+    ) -> float | None:
+        """Interpolate a variable from the nearest stations that report it."""
+        total_weight = 0.0
+        total = 0.0
+        same_point: list[float] = []
+        used = 0
+        for station_id, weight in self.weights(latitude, longitude):
+            if used >= self.neighbors:
+                break
+            value = observation_as_float(observations.get(station_id, {}).get(variable_id_str))
+            if value is None:
+                continue
+            used += 1
+            if math.isinf(weight):
+                same_point.append(value)
+                continue
+            total_weight += weight
+            total += weight * value
+
+        if same_point:
+            return sum(same_point) / len(same_point)
+        if not total_weight:
+            return None
+        return total / total_weight
@@ -1,5 +1,6 @@
 """Sensor platform for Inumet Uruguay."""
 from __future__ import annotations
+from dataclasses import replace
 
 from homeassistant.components.sensor import (
     SensorDeviceClass, SensorEntity, SensorEntityDescription, SensorStateClass
@@ -9,12 +10,11 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, NAME, VERSION, MANUFACTURER
+from .const import DOMAIN, INTERPOLATED_VARIABLES
 from .coordinator import InumetDataUpdateCoordinator
+from .entity import InumetEntity, InumetStationEntity
 
 # El 'key' ahora es el idStr de la API
 ENTITY_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
@@ -25,51 +25,65 @@ ENTITY_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(key="DirViento", name="Dirección del Viento", native_unit_of_measurement=DEGREE, state_class=SensorStateClass.MEASUREMENT, icon="mdi:compass-outline"),
 )
 
+INTERPOLATED_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = tuple(
+    replace(description, name=f"{description.name} Interpolada")
+    for description in ENTITY_DESCRIPTIONS
+    if description.key in INTERPOLATED_VARIABLES
+)
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up the sensor platform."""
     coordinator: InumetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        InumetWeatherSensor(coordinator, entry, description)
+        InumetWeatherSensor(coordinator, entry, station_id, station_name, description)
+        for station_id, station_name in coordinator.stations.items()
         for description in ENTITY_DESCRIPTIONS
     )
+    async_add_entities(
+        InumetInterpolatedSensor(coordinator, entry, description)
+        for description in INTERPOLATED_DESCRIPTIONS
+    )
 
-class InumetWeatherSensor(CoordinatorEntity[InumetDataUpdateCoordinator], SensorEntity):
+class InumetWeatherSensor(InumetStationEntity, SensorEntity):
     """Inumet Weather Sensor class."""
-    def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry, description: SensorEntityDescription) -> None:
+    def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry, station_id: int, station_name: str, description: SensorEntityDescription) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry, station_id, station_name)
         self.entity_description = description
-        self.station_id = entry.data["station_id"]
-        
-        self._attr_has_entity_name = True
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"{NAME} - {entry.title}",
-            manufacturer=MANUFACTURER,
-            sw_version=VERSION,
-            model="Estación Meteorológica",
-        )
+        self._attr_unique_id = f"{entry.entry_id}_{station_id}_{description.key}"
 
     @property
     def native_value(self) -> float | str | None:
         """Return the native value of the sensor."""
-        try:
-            estado_data = self.coordinator.data["estado"]
-            
-            # Encontrar el índice de la estación y de la variable
-            station_idx = next((i for i, estacion in enumerate(estado_data["estaciones"]) if estacion["id"] == self.station_id), None)
-            variable_idx = next((i for i, variable in enumerate(estado_data["variables"]) if variable["idStr"] == self.entity_description.key), None)
-            
-            # El último dato es el más reciente
-            date_idx = -1
+        value = self.coordinator.get_observation(self.station_id, self.entity_description.key)
+        # La API devuelve "TRAZA" para precipitaciones muy bajas
+        if value == "TRAZA":
+            return 0.0
+        return value
+
+
+class InumetInterpolatedSensor(InumetEntity, SensorEntity):
+    """Observation interpolated to the Home Assistant location from all stations."""
+    _update_keys = ("observations",)
 
-            if station_idx is not None and variable_idx is not None:
-                value = estado_data["observaciones"][variable_idx]["datos"][station_idx][date_idx]
-                # La API devuelve "TRAZA" para precipitaciones muy bajas
-                if value == "TRAZA":
-                    return 0.0
-                return value
-            return None
-        except (KeyError, IndexError, TypeError):
-            return None
+    def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry, description: SensorEntityDescription) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_interpolated_{description.key}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the value interpolated to the home location."""
+        value = self.coordinator.interpolate(
+            self.hass.config.latitude, self.hass.config.longitude, self.entity_description.key
+        )
+        return round(value, 1) if value is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the point the value was interpolated to."""
+        return {
+            "latitud": self.hass.config.latitude,
+            "longitud": self.hass.config.longitude,
+        }
@@ -0,0 +1,149 @@
+"""Services for Inumet Uruguay."""
+from __future__ import annotations
+
+from datetime import datetime
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, INTERPOLATED_VARIABLES
+from .archive import ObservationArchive
+from .coordinator import InumetDataUpdateCoordinator
+
+SERVICE_INTERPOLATE = "interpolate"
+SERVICE_GET_ALERTS = "get_alerts"
+SERVICE_QUERY_ARCHIVE = "query_archive"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_VARIABLES = "variables"
+ATTR_STATION_ID = "station_id"
+ATTR_VARIABLE = "variable"
+ATTR_START = "start"
+ATTR_END = "end"
+
+INTERPOLATE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Inclusive(ATTR_LATITUDE, "coordinates"): cv.latitude,
+        vol.Inclusive(ATTR_LONGITUDE, "coordinates"): cv.longitude,
+        vol.Optional(ATTR_VARIABLES, default=list(INTERPOLATED_VARIABLES)): vol.All(
+            cv.ensure_list, [vol.In(INTERPOLATED_VARIABLES)]
+        ),
+    }
+)
+
+GET_ALERTS_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+QUERY_ARCHIVE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_STATION_ID): vol.Coerce(int),
+        # El idStr se usa como nombre de archivo del histórico
+        vol.Required(ATTR_VARIABLE): vol.All(cv.string, vol.Match(r"^[\w-]+$")),
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> InumetDataUpdateCoordinator:
+    """Return the coordinator targeted by a service call."""
+    coordinators: dict[str, InumetDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    if entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+        if coordinator := coordinators.get(entry_id):
+            return coordinator
+        raise ServiceValidationError(f"La entrada {entry_id} de Inumet no está cargada.")
+
+    # Todas las entradas descargan el mismo snapshot nacional
+    if coordinator := next((c for c in coordinators.values() if c.data), None):
+        return coordinator
+    raise ServiceValidationError("No hay ninguna entrada de Inumet con datos disponibles.")
+
+
+async def _async_interpolate(call: ServiceCall) -> ServiceResponse:
+    """Interpolate observations to a point from the whole station network."""
+    hass = call.hass
+    coordinator = _get_coordinator(hass, call)
+    latitude = call.data.get(ATTR_LATITUDE, hass.config.latitude)
+    longitude = call.data.get(ATTR_LONGITUDE, hass.config.longitude)
+    if not (coordinator.data or {}).get("observations"):
+        raise ServiceValidationError(
+            "La entrada de Inumet no descarga observaciones: habilita algún sensor, tiempo o cámara."
+        )
+
+    return {
+        "latitud": latitude,
+        "longitud": longitude,
+        "valores": {
+            variable: coordinator.interpolate(latitude, longitude, variable)
+            for variable in call.data[ATTR_VARIABLES]
+        },
+    }
+
+
+async def _async_get_alerts(call: ServiceCall) -> ServiceResponse:
+    """Return the full text of the active alerts."""
+    coordinator = _get_coordinator(call.hass, call)
+    return {
+        "hay_alertas": coordinator.data.get("has_alerts", False) if coordinator.data else False,
+        "alertas": coordinator.get_alerts(),
+    }
+
+
+def _epoch(value: datetime) -> int:
+    """Convert a service datetime (naive means local time) to epoch seconds."""
+    return int(dt_util.as_utc(value).timestamp())
+
+
+async def _async_query_archive(call: ServiceCall) -> ServiceResponse:
+    """Return the archived observations of a station and variable in a time range."""
+    hass = call.hass
+    archive: ObservationArchive | None = hass.data.get(f"{DOMAIN}_archive")
+    if archive is None:
+        raise ServiceValidationError("No hay ninguna entrada de Inumet cargada.")
+
+    start = _epoch(call.data[ATTR_START])
+    end = _epoch(call.data.get(ATTR_END, dt_util.utcnow()))
+    if end < start:
+        raise ServiceValidationError("El fin del rango es anterior al inicio.")
+
+    points = await hass.async_add_executor_job(
+        archive.query, call.data[ATTR_STATION_ID], call.data[ATTR_VARIABLE], start, end
+    )
+    return {
+        "estacion": call.data[ATTR_STATION_ID],
+        "variable": call.data[ATTR_VARIABLE],
+        "observaciones": [
+            {"fecha": dt_util.utc_from_timestamp(timestamp).isoformat(), "valor": value}
+            for timestamp, value in points
+        ],
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_INTERPOLATE,
+        _async_interpolate,
+        schema=INTERPOLATE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ALERTS,
+        _async_get_alerts,
+        schema=GET_ALERTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_ARCHIVE,
+        _async_query_archive,
+        schema=QUERY_ARCHIVE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,178 @@
+"""Incremental parsing of the national estadoActual payload for Inumet Uruguay."""
+from __future__ import annotations
+from collections.abc import AsyncIterator
+import codecs
+import json
+from typing import Any
+
+# Claves del nivel superior que se materializan; el resto se lee y se descarta
+KEPT_KEYS = ("estaciones", "variables", "fechas")
+
+# Tamaño de los fragmentos en que se lee el cuerpo de la respuesta
+CHUNK_SIZE = 64 * 1024
+
+# Se compacta el buffer cuando lo ya consumido supera este tamaño
+_COMPACT_THRESHOLD = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# Caracteres que pueden continuar un número JSON
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class _JsonStream:
+    """Pull reader over a chunked JSON body.
+
+    Structural tokens are walked by hand and every leaf value (a station,
+    a row of observations) is decoded with the C decoder, so only the value
+    being read is ever held in memory besides the unread buffer.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        """Initialize the reader."""
+        self._chunks = chunks
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> bool:
+        """Append the next chunk to the buffer; return False at end of body."""
+        if self._eof:
+            return False
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        try:
+            chunk = await anext(self._chunks)
+        except StopAsyncIteration:
+            self._eof = True
+            self._buffer += self._utf8.decode(b"", final=True)
+            return False
+        self._buffer += self._utf8.decode(chunk)
+        return True
+
+    async def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not await self._fill():
+                raise ValueError("Fin inesperado del JSON")
+
+    async def _expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be `char`."""
+        if (found := await self._peek()) != char:
+            raise ValueError(f"Se esperaba {char!r} y se encontró {found!r}")
+        self._pos += 1
+
+    async def value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        await self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Valor incompleto: se necesita más del cuerpo
+                if not await self._fill():
+                    raise
+                continue
+            # Un número cortado por el chunk ("1." o "1.25e") se decodifica sin
+            # error pero incompleto: si llega al final del buffer, se lee más
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                number_end = end
+                while number_end < len(self._buffer) and self._buffer[number_end] in _NUMBER_CHARS:
+                    number_end += 1
+                if number_end == len(self._buffer) and await self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    async def members(self) -> AsyncIterator[str]:
+        """Iterate over the keys of an object; the caller consumes each value."""
+        await self._expect("{")
+        if await self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = await self.value()
+            await self._expect(":")
+            yield key
+            separator = await self._peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Separador inesperado {separator!r} en objeto")
+
+    async def elements(self) -> AsyncIterator[int]:
+        """Iterate over the positions of an array; the caller consumes each value."""
+        await self._expect("[")
+        if await self._peek() == "]":
+            self._pos += 1
+            return
+        position = 0
+        while True:
+            yield position
+            separator = await self._peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Separador inesperado {separator!r} en lista")
+            position += 1
+
+
+async def _parse_observaciones(stream: _JsonStream, positions: set[int] | None) -> list[dict]:
+    """Read 'observaciones', keeping full rows only for the wanted station positions.
+
+    Rows of the other stations are reduced to their latest value, which is
+    all the interpolation needs.
+    """
+    observaciones = []
+    async for _ in stream.elements():
+        observacion: dict[str, Any] = {}
+        async for key in stream.members():
+            if key != "datos":
+                observacion[key] = await stream.value()
+                continue
+            datos = []
+            async for position in stream.elements():
+                row = await stream.value()
+                if positions is None or position in positions:
+                    datos.append(row)
+                else:
+                    datos.append(row[-1:] if isinstance(row, list) else [])
+            observacion["datos"] = datos
+        observaciones.append(observacion)
+    return observaciones
+
+
+async def async_parse_estado(chunks: AsyncIterator[bytes], station_ids: set[int]) -> dict:
+    """Parse estadoActual from a chunked body, keeping only what the integration uses.
+
+    'estaciones', 'variables' and 'fechas' are kept whole; 'observaciones'
+    keeps the full rows of `station_ids` and the latest value of the rest.
+    """
+    stream = _JsonStream(chunks)
+    estado: dict[str, Any] = {}
+    # Posiciones de las estaciones configuradas; None mientras no se leyó 'estaciones'
+    positions: set[int] | None = None
+
+    async for key in stream.members():
+        if key == "observaciones":
+            estado[key] = await _parse_observaciones(stream, positions)
+        elif key in KEPT_KEYS:
+            estado[key] = await stream.value()
+            if key == "estaciones":
+                positions = {
+                    position
+                    for position, station in enumerate(estado[key])
+                    if station.get("id") in station_ids
+                }
+        else:
+            await stream.value()
+
+    return estado
@@ -11,13 +11,12 @@ from homeassistant.components.weather import (
 from homeassistant.const import UnitOfPressure, UnitOfSpeed, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, NAME, VERSION, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import InumetDataUpdateCoordinator
+from .entity import InumetStationEntity
 
 # --- MAPEOS MOVIDOS AQUÍ PARA EVITAR ERRORES DE IMPORTACIÓN ---
 DEPARTMENT_TO_ZONE_ID_MAP = {
@@ -38,54 +37,46 @@ CONDITION_MAP = {
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up the weather platform."""
     coordinator: InumetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([InumetWeather(coordinator, entry)])
+    async_add_entities(
+        InumetWeather(coordinator, entry, station_id, station_name)
+        for station_id, station_name in coordinator.stations.items()
+    )
 
-class InumetWeather(CoordinatorEntity[InumetDataUpdateCoordinator], WeatherEntity):
+class InumetWeather(InumetStationEntity, WeatherEntity):
     """Inumet Weather Entity."""
 
+    _attr_name = None
+    _update_keys = ("forecast",)
     _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_native_pressure_unit = UnitOfPressure.HPA
     _attr_native_wind_speed_unit = UnitOfSpeed.KNOTS # Volvemos a nudos como el original
     _attr_attribution = "Datos proporcionados por Inumet"
     _attr_supported_features = WeatherEntityFeature.FORECAST_DAILY
 
-    def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(self, coordinator: InumetDataUpdateCoordinator, entry: ConfigEntry, station_id: int, station_name: str) -> None:
         """Initialize the weather entity."""
-        super().__init__(coordinator)
-        self.station_id = entry.data["station_id"]
-        self._attr_name = entry.title
-        self._attr_unique_id = f"{entry.entry_id}_weather"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"{NAME} - {entry.title}",
-            manufacturer=MANUFACTURER,
-            sw_version=VERSION,
-            model="Estación Meteorológica",
-        )
+        super().__init__(coordinator, entry, station_id, station_name)
+        self._attr_unique_id = f"{entry.entry_id}_{station_id}_weather"
 
     def _get_current_observation(self, variable_id_str: str) -> float | None:
         """Helper to get a value from the observations data."""
+        value = self.coordinator.get_observation(self.station_id, variable_id_str)
         try:
-            if not self.coordinator.data or not self.coordinator.data.get("estado"): return None
-            estado_data = self.coordinator.data["estado"]
-            station_idx = next(i for i, est in enumerate(estado_data["estaciones"]) if est["id"] == self.station_id)
-            variable_idx = next(i for i, var in enumerate(estado_data["variables"]) if var["idStr"] == variable_id_str)
-            value = estado_data["observaciones"][variable_idx]["datos"][station_idx][-1]
             return float(value) if value is not None and value != "variable" else None
-        except (StopIteration, KeyError, IndexError, TypeError, ValueError):
+        except (TypeError, ValueError):
             return None
 
+    def _get_zone_id(self) -> int | None:
+        """Helper to get the forecast zone of the station."""
+        station_data = self.coordinator.get_station(self.station_id)
+        if not station_data: return None
+        return DEPARTMENT_TO_ZONE_ID_MAP.get(station_data.get("estado"))
+
     def _get_forecast_item_for_day(self, day_offset: int) -> dict | None:
         """Helper to get the forecast data for a specific day."""
-        if not self.coordinator.data or not self.coordinator.data.get("forecast"): return None
-        station_data = next((est for est in self.coordinator.data.get("estado", {}).get("estaciones", []) if est["id"] == self.station_id), None)
-        if not station_data: return None
-        zone_id = DEPARTMENT_TO_ZONE_ID_MAP.get(station_data.get("estado"))
+        zone_id = self._get_zone_id()
         if not zone_id: return None
-        for item in self.coordinator.data["forecast"].get("items", []):
-            if item.get("zonaId") == zone_id and item.get("diaMasN") == day_offset:
-                return item
-        return None
+        return self.coordinator.get_forecast_item(zone_id, day_offset)
 
     @property
     def condition(self) -> str | None:
@@ -122,33 +113,29 @@ class InumetWeather(CoordinatorEntity[InumetDataUpdateCoordinator], WeatherEntit
         """Return the daily forecast."""
         if not self.coordinator.data or not self.coordinator.data.get("forecast"): return None
         
-        forecast_items = self.coordinator.data["forecast"].get("items", [])
         start_date_str = self.coordinator.data["forecast"].get("inicioPronostico")
-        if not forecast_items or not start_date_str: return None
+        if not start_date_str: return None
         
-        station_data = next((est for est in self.coordinator.data.get("estado", {}).get("estaciones", []) if est["id"] == self.station_id), None)
-        if not station_data: return None
-        zone_id = DEPARTMENT_TO_ZONE_ID_MAP.get(station_data.get("estado"))
+        zone_id = self._get_zone_id()
         if not zone_id: return None
+        zone_items = self.coordinator.data["forecast_zones"].get(zone_id)
+        if not zone_items: return None
         
         start_date = dt_util.parse_date(start_date_str)
         forecasts = []
 
-        for item in forecast_items:
-            if item.get("zonaId") == zone_id:
-                day_offset = item.get("diaMasN", 0)
-                
-                # --- El arreglo definitivo para la fecha y zona horaria ---
-                forecast_date = start_date + timedelta(days=day_offset)
-                naive_datetime = dt_util.dt.datetime.combine(forecast_date, time.min)
-                aware_datetime = dt_util.as_local(naive_datetime)
-
-                forecast = {
-                    "datetime": aware_datetime.isoformat(),
-                    "native_temperature": item.get("tempMax"),
-                    "native_templow": item.get("tempMin"),
-                    "condition": CONDITION_MAP.get(str(item.get("estadoTiempo"))),
-                }
-                forecasts.append(forecast)
+        for day_offset, item in sorted(zone_items.items()):
+            # --- El arreglo definitivo para la fecha y zona horaria ---
+            forecast_date = start_date + timedelta(days=day_offset)
+            naive_datetime = dt_util.dt.datetime.combine(forecast_date, time.min)
+            aware_datetime = dt_util.as_local(naive_datetime)
+
+            forecast = {
+                "datetime": aware_datetime.isoformat(),
+                "native_temperature": item.get("tempMax"),
+                "native_templow": item.get("tempMin"),
+                "condition": CONDITION_MAP.get(str(item.get("estadoTiempo"))),
+            }
+            forecasts.append(forecast)
         
         return forecasts
\ No newline at end of file
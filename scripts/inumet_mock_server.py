@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Inumet endpoints used by the integration.
+
+Record real payloads once, then serve them offline with their timestamps
+shifted to the present so the integration can be soak-tested in replay mode
+(options flow > advanced > replay URL) at accelerated polling rates.
+
+    python scripts/inumet_mock_server.py record recordings/ --count 6 --interval 600
+    python scripts/inumet_mock_server.py serve recordings/ --port 8099 --step 30
+
+Each recording is a numbered snapshot directory that mirrors the URL paths of
+the real endpoints. When serving, snapshots are rotated every ``--step``
+seconds and every snapshot is time-shifted as if it had just been recorded.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+import json
+import logging
+import mimetypes
+from pathlib import Path
+import re
+from typing import Any
+from urllib.parse import urlsplit
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, web
+
+_LOGGER = logging.getLogger("inumet_mock_server")
+
+# Mismos endpoints que custom_components/inumet_uruguay/const.py
+ADV_GRAL_URL = "https://inumet.gub.uy/reportes/riesgo/advGral.mch"
+ENDPOINTS = (
+    "https://www.inumet.gub.uy/reportes/estadoActual/datos_inumet_ui_publica.mch",
+    "https://w2b.inumet.gub.uy/oapi/collections/urn:wmo:md:uy-inumet:cap-alerts/items?f=json",
+    "https://www.inumet.gub.uy/reportes/pronosticos/pronosticoV4.json",
+    ADV_GRAL_URL,
+    "https://www.inumet.gub.uy/admin/check-avisos",
+)
+UV_MAP_URL_TEMPLATE = "https://www.inumet.gub.uy/reportes/indice_uv/iuvcsk_{year}{day_of_year}_{time}.webp"
+FWI_MAP_URL_TEMPLATE = "https://www.inumet.gub.uy/reportes/fwi/FWI_{date}.png"
+CAMERA_URL_TEMPLATE = "https://www.inumet.gub.uy/reportes/camaras_estaciones/{id_str}.webm"
+
+# Los mapas se guardan con nombre fijo y se sirven para cualquier fecha pedida
+UV_MAP_PATH = "reportes/indice_uv/latest.webp"
+FWI_MAP_PATH = "reportes/fwi/latest.png"
+_UV_REQUEST_RE = re.compile(r"^reportes/indice_uv/iuvcsk_\d{7}_\d{4}\.webp$")
+_FWI_REQUEST_RE = re.compile(r"^reportes/fwi/FWI_\d{4}_\d{2}_\d{2}\.png$")
+
+_LIVE_HOSTS_RE = re.compile(r"^https?://(?:www\.|w2b\.)?inumet\.gub\.uy")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATETIME_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?$"
+)
+
+MANIFEST = "manifest.json"
+
+
+def _storage_path(url_path: str) -> str:
+    """Return the relative file path a URL path is stored under."""
+    # ':' no es válido en nombres de archivo de Windows (aparece en la URL de alertas CAP)
+    return url_path.lstrip("/").replace(":", "_")
+
+
+# ---------------------------------------------------------------------------
+# Grabación
+
+
+async def _download(session: ClientSession, url: str) -> bytes | None:
+    """Download a URL, returning None on any error."""
+    try:
+        async with session.get(url, timeout=ClientTimeout(total=30)) as response:
+            if response.status != 200:
+                _LOGGER.warning("HTTP %s al descargar %s", response.status, url)
+                return None
+            return await response.read()
+    except (ClientError, asyncio.TimeoutError) as err:
+        _LOGGER.warning("Error al descargar %s: %s", url, err)
+        return None
+
+
+def _alert_map_url(adv_gral: bytes | None) -> str | None:
+    """Return the live alert map URL referenced by an advGral payload."""
+    try:
+        url = json.loads(adv_gral).get("mapaMerge") if adv_gral else None
+    except (UnicodeDecodeError, json.JSONDecodeError, AttributeError):
+        return None
+    return url if isinstance(url, str) and _LIVE_HOSTS_RE.match(url) else None
+
+
+async def _download_latest_uv(session: ClientSession, now: datetime) -> bytes | None:
+    """Download the latest UV map, searching backwards like the coordinator."""
+    for i in range(12):
+        check_time = now - timedelta(minutes=i * 10)
+        url = UV_MAP_URL_TEMPLATE.format(
+            year=check_time.strftime("%Y"),
+            day_of_year=check_time.strftime("%j"),
+            time=f"{check_time.hour:02d}{(check_time.minute // 10) * 10:02d}",
+        )
+        if (body := await _download(session, url)) is not None:
+            return body
+    return None
+
+
+async def record_snapshot(session: ClientSession, directory: Path, cameras: list[str]) -> None:
+    """Record one snapshot of every endpoint into a directory."""
+    now = datetime.now(timezone.utc)
+    files: dict[str, bytes | None] = {
+        _storage_path(urlsplit(url).path): await _download(session, url) for url in ENDPOINTS
+    }
+    # El mapa de alertas que referencia advGral se sirve desde el servidor local
+    if (map_url := _alert_map_url(files[_storage_path(urlsplit(ADV_GRAL_URL).path)])) is not None:
+        files[_storage_path(urlsplit(map_url).path)] = await _download(session, map_url)
+    files[UV_MAP_PATH] = await _download_latest_uv(session, now)
+    files[FWI_MAP_PATH] = await _download(
+        session, FWI_MAP_URL_TEMPLATE.format(date=now.astimezone().strftime("%Y_%m_%d"))
+    )
+    for id_str in cameras:
+        url = CAMERA_URL_TEMPLATE.format(id_str=id_str)
+        files[_storage_path(urlsplit(url).path)] = await _download(session, url)
+
+    for relative_path, body in files.items():
+        if body is None:
+            continue
+        path = directory / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+
+    (directory / MANIFEST).write_text(json.dumps({"recorded_at": now.isoformat()}))
+    _LOGGER.info("Snapshot grabado en %s", directory)
+
+
+async def record(output: Path, count: int, interval: int, cameras: list[str]) -> None:
+    """Record a series of snapshots, appending after the existing ones."""
+    output.mkdir(parents=True, exist_ok=True)
+    start = len([path for path in output.iterdir() if (path / MANIFEST).exists()])
+    async with ClientSession() as session:
+        for index in range(start, start + count):
+            await record_snapshot(session, output / f"{index:04d}", cameras)
+            if index < start + count - 1:
+                await asyncio.sleep(interval)
+
+
+# ---------------------------------------------------------------------------
+# Reproducción
+
+
+def _shift(value: Any, offset: timedelta, day_offset: timedelta, base_url: str) -> Any:
+    """Shift every date/datetime string in a payload and point live URLs at us."""
+    if isinstance(value, dict):
+        return {key: _shift(item, offset, day_offset, base_url) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_shift(item, offset, day_offset, base_url) for item in value]
+    if not isinstance(value, str):
+        return value
+
+    if _DATE_RE.match(value):
+        return (date.fromisoformat(value) + day_offset).isoformat()
+    if _DATETIME_RE.match(value):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+        shifted = (parsed + offset).isoformat(sep="T" if "T" in value else " ")
+        return shifted.replace("+00:00", "Z") if value.endswith("Z") else shifted
+    if _LIVE_HOSTS_RE.match(value):
+        return _LIVE_HOSTS_RE.sub(base_url, value)
+    return value
+
+
+class ReplayServer:
+    """Serve recorded snapshots, rotating them and shifting them to the present."""
+
+    def __init__(self, recordings: Path, step: int) -> None:
+        """Initialize the server."""
+        self.snapshots = sorted(
+            path for path in recordings.iterdir() if (path / MANIFEST).exists()
+        )
+        if not self.snapshots:
+            raise SystemExit(f"No hay snapshots grabados en {recordings}")
+        self.step = step
+        self.started = datetime.now(timezone.utc)
+        # Los payloads se leen una vez por snapshot y se desplazan en cada pedido
+        self._cache: dict[Path, Any] = {}
+
+    def _current_snapshot(self, now: datetime) -> tuple[Path, datetime]:
+        """Return the active snapshot and the time it was recorded."""
+        elapsed = (now - self.started).total_seconds()
+        index = int(elapsed // self.step) % len(self.snapshots) if self.step else 0
+        snapshot = self.snapshots[index]
+        manifest = json.loads((snapshot / MANIFEST).read_text())
+        return snapshot, datetime.fromisoformat(manifest["recorded_at"])
+
+    def _load_json(self, path: Path) -> Any:
+        """Return the parsed JSON of a file, or None if it is not JSON."""
+        if path not in self._cache:
+            try:
+                self._cache[path] = json.loads(path.read_bytes())
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                self._cache[path] = None
+        return self._cache[path]
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Serve a recorded payload for any requested path."""
+        now = datetime.now(timezone.utc)
+        snapshot, recorded_at = self._current_snapshot(now)
+
+        relative_path = _storage_path(request.path)
+        if _UV_REQUEST_RE.match(relative_path):
+            relative_path = UV_MAP_PATH
+        elif _FWI_REQUEST_RE.match(relative_path):
+            relative_path = FWI_MAP_PATH
+
+        path = (snapshot / relative_path).resolve()
+        if not path.is_relative_to(snapshot.resolve()) or not path.is_file():
+            return web.Response(status=404)
+
+        payload = self._load_json(path)
+        if payload is None:
+            content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            return web.Response(body=path.read_bytes(), content_type=content_type)
+
+        base_url = f"{request.scheme}://{request.host}"
+        day_offset = timedelta(days=(now.astimezone().date() - recorded_at.astimezone().date()).days)
+        return web.json_response(_shift(payload, now - recorded_at, day_offset, base_url))
+
+
+def serve(recordings: Path, host: str, port: int, step: int) -> None:
+    """Run the replay server until interrupted."""
+    server = ReplayServer(recordings, step)
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", server.handle)
+    _LOGGER.info(
+        "Sirviendo %d snapshot(s) de %s, rotando cada %ss", len(server.snapshots), recordings, step
+    )
+    web.run_app(app, host=host, port=port)
+
+
+def main() -> None:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="grabar snapshots de los endpoints reales")
+    record_parser.add_argument("output", type=Path)
+    record_parser.add_argument("--count", type=int, default=1)
+    record_parser.add_argument("--interval", type=int, default=600, help="segundos entre snapshots")
+    record_parser.add_argument(
+        "--camera", action="append", default=[], help="idStr de una estación con cámara a grabar"
+    )
+
+    serve_parser = subparsers.add_parser("serve", help="servir los snapshots grabados")
+    serve_parser.add_argument("recordings", type=Path)
+    serve_parser.add_argument(
+        "--host", default="127.0.0.1", help="usar 0.0.0.0 si Home Assistant corre en otro equipo"
+    )
+    serve_parser.add_argument("--port", type=int, default=8099)
+    serve_parser.add_argument(
+        "--step", type=int, default=60, help="segundos antes de pasar al siguiente snapshot (0: fijo)"
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.command == "record":
+        asyncio.run(record(args.output, args.count, args.interval, args.camera))
+    else:
+        serve(args.recordings, args.host, args.port, args.step)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Tests for the size-capped attributes of the alerts sensor."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import random
+
+import pytest
+
+# alert_attributes.py no depende de Home Assistant; se carga sin importar el paquete
+_SPEC = importlib.util.spec_from_file_location(
+    "inumet_alert_attributes",
+    Path(__file__).parents[1] / "custom_components" / "inumet_uruguay" / "alert_attributes.py",
+)
+alert_attributes = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(alert_attributes)
+
+json_size = alert_attributes.json_size
+
+
+def _alert(alert_id: int, description: str = "", instructions: str = "", areas: str = "") -> dict:
+    return {
+        "id": alert_id,
+        "titulo": "Tormentas fuertes",
+        "severidad": "Severe",
+        "certeza": "Likely",
+        "descripcion": description,
+        "areas_afectadas": areas,
+        "inicio": "2024-05-01T10:00:00-03:00",
+        "expira": "2024-05-02T10:00:00-03:00",
+        "instrucciones": instructions,
+    }
+
+
+def test_alerts_that_fit_are_unchanged() -> None:
+    alerts = [_alert(1, "lluvia"), _alert(2, "viento")]
+    assert alert_attributes.cap_alerts(alerts, 4096) == alerts
+
+
+def test_one_long_description_is_truncated_not_dropped() -> None:
+    alerts = [_alert(1, "Descripción larga. " * 2000)]
+    capped = alert_attributes.cap_alerts(alerts, 4096)
+
+    assert len(capped) == 1
+    assert json_size(capped) <= 4096
+    assert capped[0]["descripcion"].endswith("…")
+    assert json_size(capped) > 3900  # se aprovecha el espacio disponible
+
+
+def test_short_alerts_stay_whole_and_long_ones_share_the_rest() -> None:
+    short = _alert(2, "breve")
+    alerts = [_alert(1, "x" * 20000), short, _alert(3, "y" * 20000)]
+    capped = alert_attributes.cap_alerts(alerts, 4096)
+
+    assert [alert["id"] for alert in capped] == [1, 2, 3]
+    assert capped[1] == short
+    assert json_size(capped) <= 4096
+    assert abs(len(capped[0]["descripcion"]) - len(capped[2]["descripcion"])) <= 1
+
+
+def test_long_affected_areas_are_truncated_last() -> None:
+    alert = _alert(1, "d" * 500, "i" * 500, "Montevideo, Canelones, " * 500)
+    truncated = alert_attributes.truncate_alert(alert, 1024)
+
+    assert truncated is not None
+    assert json_size(truncated) <= 1024
+    assert truncated["instrucciones"] == ""
+    assert truncated["descripcion"] == ""
+    assert truncated["areas_afectadas"].startswith("Montevideo")
+
+
+def test_truncation_does_not_split_characters_or_overshoot_with_escapes() -> None:
+    alert = _alert(1, 'ñ"\\\n😀' * 3000)
+    for max_size in (300, 1000, 4000):
+        truncated = alert_attributes.truncate_alert(alert, max_size)
+        assert json_size(truncated) <= max_size
+        truncated["descripcion"].encode()
+
+
+def test_alert_that_cannot_fit_returns_none() -> None:
+    assert alert_attributes.truncate_alert(_alert(1, "x" * 100), 50) is None
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_alerts_never_exceed_the_cap(seed: int) -> None:
+    rng = random.Random(seed)
+    alerts = [
+        _alert(
+            alert_id,
+            "".join(rng.choice('aé"\\\n😀') for _ in range(rng.randint(0, 3000))),
+            "b" * rng.randint(0, 2000),
+            "Rocha, " * rng.randint(0, 500),
+        )
+        for alert_id in range(rng.randint(1, 6))
+    ]
+    max_size = rng.randint(1024, 12288)
+    capped = alert_attributes.cap_alerts(alerts, max_size)
+
+    assert json_size(capped) <= max_size
+    # Solo se descartan alertas si no entran ni con los textos vacíos
+    if (max_size - 2) // len(alerts) > json_size(_alert(0)) + 1:
+        assert len(capped) == len(alerts)
@@ -0,0 +1,118 @@
+"""Tests for the append-only observation archive."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import types
+
+import pytest
+
+# archive.py solo importa interpolation.py; ambos se cargan sin importar Home Assistant
+_PACKAGE_DIR = Path(__file__).parents[1] / "custom_components" / "inumet_uruguay"
+_PACKAGE = types.ModuleType("inumet_archive_standalone")
+_PACKAGE.__path__ = [str(_PACKAGE_DIR)]
+sys.modules[_PACKAGE.__name__] = _PACKAGE
+for _name in ("interpolation", "archive"):
+    _spec = importlib.util.spec_from_file_location(
+        f"{_PACKAGE.__name__}.{_name}", _PACKAGE_DIR / f"{_name}.py"
+    )
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules[_spec.name] = _module
+    _spec.loader.exec_module(_module)
+archive = sys.modules[f"{_PACKAGE.__name__}.archive"]
+
+ESTADO = {
+    "estaciones": [{"id": 10}, {"id": 20}, {"id": 30}],
+    "variables": [{"idStr": "TempAire"}, {"idStr": "../malo"}],
+    "observaciones": [
+        {"datos": [[11.0, 12.0, 13.0], [21.0], [31.0, 32.0, 33.0]]},
+        {"datos": [[1, 2, 3], [1], [1, 2, 3]]},
+    ],
+}
+TIMESTAMPS = [1000, 2000, 3000]
+
+
+@pytest.fixture
+def observation_archive(tmp_path: Path):
+    return archive.ObservationArchive(tmp_path)
+
+
+def test_collect_history_aligns_rows_from_the_end() -> None:
+    history = archive.collect_history(ESTADO, {10, 20}, TIMESTAMPS)
+
+    assert history == {
+        (10, "TempAire"): [(1000, 11.0), (2000, 12.0), (3000, 13.0)],
+        # Una fila más corta que 'fechas' corresponde a las fechas más recientes
+        (20, "TempAire"): [(3000, 21.0)],
+    }
+
+
+def test_collect_history_skips_missing_values_and_dates() -> None:
+    estado = {
+        "estaciones": [{"id": 10}],
+        "variables": [{"idStr": "TempAire"}],
+        "observaciones": [{"datos": [[None, "TRAZA", 5.5]]}],
+    }
+    assert archive.collect_history(estado, {10}, [None, 2000, 3000]) == {
+        (10, "TempAire"): [(2000, 0.0), (3000, 5.5)]
+    }
+
+
+def test_same_snapshot_twice_writes_nothing(observation_archive, tmp_path: Path) -> None:
+    history = archive.collect_history(ESTADO, {10, 20}, TIMESTAMPS)
+
+    assert observation_archive.append_history(history) == 4
+    assert observation_archive.append_history(history) == 0
+    # También tras reiniciar, sin la caché de últimos timestamps
+    assert archive.ObservationArchive(tmp_path).append_history(history) == 0
+    assert (tmp_path / "10" / "TempAire.bin").stat().st_size == 3 * archive.RECORD.size
+
+
+def test_only_newer_points_are_appended(observation_archive) -> None:
+    observation_archive.append(10, "TempAire", [(1000, 1.0), (2000, 2.0)])
+
+    assert observation_archive.append(10, "TempAire", [(2000, 2.0), (1500, 1.5), (3000, 3.0)]) == 1
+    assert observation_archive.query(10, "TempAire", 0, 10000) == [
+        (1000, 1.0), (2000, 2.0), (3000, 3.0)
+    ]
+
+
+def test_torn_last_record_is_truncated_on_next_append(tmp_path: Path) -> None:
+    archive.ObservationArchive(tmp_path).append(10, "TempAire", [(1000, 1.0), (2000, 2.0)])
+    path = tmp_path / "10" / "TempAire.bin"
+    with path.open("ab") as file:
+        file.write(archive.RECORD.pack(3000, 3.0)[:5])
+
+    reopened = archive.ObservationArchive(tmp_path)
+    assert reopened.append(10, "TempAire", [(3000, 3.0)]) == 1
+    assert path.stat().st_size == 3 * archive.RECORD.size
+    assert reopened.query(10, "TempAire", 0, 10000) == [(1000, 1.0), (2000, 2.0), (3000, 3.0)]
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        (1000, 3000, [1000, 2000, 3000]),  # los extremos se incluyen
+        (1001, 2999, [2000]),
+        (0, 999, []),
+        (3001, 9999, []),
+        (2000, 2000, [2000]),
+        (0, 10**10, [1000, 2000, 3000]),
+    ],
+)
+def test_query_range_edges(observation_archive, start: int, end: int, expected: list[int]) -> None:
+    observation_archive.append(10, "TempAire", [(1000, 1.0), (2000, 2.0), (3000, 3.0)])
+
+    points = observation_archive.query(10, "TempAire", start, end)
+    assert [timestamp for timestamp, _ in points] == expected
+
+
+def test_query_missing_file_is_empty(observation_archive) -> None:
+    assert observation_archive.query(99, "TempAire", 0, 10**10) == []
+    assert observation_archive.series() == {}
+
+
+def test_series_lists_archived_variables(observation_archive) -> None:
+    observation_archive.append_history(archive.collect_history(ESTADO, {10, 30}, TIMESTAMPS))
+    assert observation_archive.series() == {10: ["TempAire"], 30: ["TempAire"]}
@@ -0,0 +1,77 @@
+"""Tests for the inverse-distance interpolator."""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# interpolation.py no depende de Home Assistant; se carga sin importar el paquete
+_SPEC = importlib.util.spec_from_file_location(
+    "inumet_interpolation",
+    Path(__file__).parents[1] / "custom_components" / "inumet_uruguay" / "interpolation.py",
+)
+interpolation = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(interpolation)
+
+MONTEVIDEO = (-34.9, -56.2)
+STATIONS = {
+    1: {"latitud": MONTEVIDEO[0], "longitud": MONTEVIDEO[1]},
+    2: {"latitud": MONTEVIDEO[0], "longitud": MONTEVIDEO[1]},
+    3: {"latitud": -33.0, "longitud": -55.0},
+}
+
+
+@pytest.fixture
+def interpolator():
+    interpolator = interpolation.StationInterpolator()
+    interpolator.update_geometry(STATIONS)
+    return interpolator
+
+
+def test_co_located_stations_are_averaged(interpolator) -> None:
+    observations = {1: {"T": 10}, 2: {"T": 20}, 3: {"T": 30}}
+    assert interpolator.interpolate(*MONTEVIDEO, "T", observations) == 15
+
+
+def test_missing_co_located_stations_fall_back_to_neighbours(interpolator) -> None:
+    assert interpolator.interpolate(*MONTEVIDEO, "T", {3: {"T": 30}}) == pytest.approx(30)
+
+
+def test_neighbours_without_the_variable_are_skipped() -> None:
+    interpolator = interpolation.StationInterpolator()
+    stations = {
+        station_id: {"latitud": MONTEVIDEO[0] + station_id / 100, "longitud": MONTEVIDEO[1]}
+        for station_id in range(1, interpolator.neighbors + 1)
+    }
+    stations[99] = {"latitud": -33.0, "longitud": -55.0}
+    interpolator.update_geometry(stations)
+    observations = {station_id: {"TempAire": 12} for station_id in range(1, interpolator.neighbors + 1)}
+    observations[99] = {"PresAtmMar": 1013}
+
+    assert interpolator.interpolate(*MONTEVIDEO, "PresAtmMar", observations) == pytest.approx(1013)
+
+
+def test_only_the_nearest_reporting_stations_are_used() -> None:
+    interpolator = interpolation.StationInterpolator(neighbors=2)
+    interpolator.update_geometry(
+        {
+            1: {"latitud": -34.0, "longitud": -56.0},
+            2: {"latitud": -34.1, "longitud": -56.0},
+            3: {"latitud": -34.2, "longitud": -56.0},
+            4: {"latitud": -30.0, "longitud": -56.0},
+        }
+    )
+    observations = {1: {"T": None}, 2: {"T": 10}, 3: {"T": 10}, 4: {"T": 1000}}
+    assert interpolator.interpolate(-34.0, -56.0, "T", observations) == pytest.approx(10)
+
+
+def test_between_stations_is_weighted(interpolator) -> None:
+    observations = {1: {"T": 10}, 2: {"T": 10}, 3: {"T": 30}}
+    assert 10 < interpolator.interpolate(-34.0, -56.0, "T", observations) < 30
+
+
+def test_weight_cache_is_bounded(interpolator) -> None:
+    for index in range(500):
+        interpolator.weights(-34 + index / 100, -56)
+    assert len(interpolator._weights) == interpolation._MAX_CACHED_POINTS
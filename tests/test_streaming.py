@@ -0,0 +1,134 @@
+"""Tests for the incremental estadoActual parser."""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+import random
+
+import pytest
+
+# streaming.py no depende de Home Assistant; se carga sin importar el paquete
+_SPEC = importlib.util.spec_from_file_location(
+    "inumet_streaming",
+    Path(__file__).parents[1] / "custom_components" / "inumet_uruguay" / "streaming.py",
+)
+streaming = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(streaming)
+
+
+async def _chunks(body: bytes, sizes: list[int]):
+    """Yield a body split at the given chunk sizes, then the rest."""
+    position = 0
+    for size in sizes:
+        if position >= len(body):
+            return
+        yield body[position : position + size]
+        position += size
+    if position < len(body):
+        yield body[position:]
+
+
+def _parse(body: bytes, station_ids: set[int], sizes: list[int]) -> dict:
+    return asyncio.run(streaming.async_parse_estado(_chunks(body, sizes), station_ids))
+
+
+def _expected(payload: dict, station_ids: set[int]) -> dict:
+    """Reduce a payload the way the parser is meant to, from json.loads."""
+    positions = {
+        position
+        for position, station in enumerate(payload["estaciones"])
+        if station["id"] in station_ids
+    }
+    expected = {key: payload[key] for key in streaming.KEPT_KEYS}
+    expected["observaciones"] = [
+        {
+            **observacion,
+            "datos": [
+                row if position in positions else row[-1:]
+                for position, row in enumerate(observacion["datos"])
+            ],
+        }
+        for observacion in payload["observaciones"]
+    ]
+    return expected
+
+
+def _random_number(rng: random.Random) -> int | float:
+    return rng.choice(
+        [
+            rng.randint(-1000, 1000),
+            round(rng.uniform(-50, 50), rng.randint(1, 4)),
+            rng.uniform(-1, 1) * 10 ** rng.randint(-20, 20),
+        ]
+    )
+
+
+def _random_payload(rng: random.Random) -> dict:
+    stations = [
+        {
+            "id": station_id,
+            "NombreEstacion": rng.choice(["Melo", "Artigas", "Ñu Porã", "Rocha \"Centro\""]),
+            "latitud": round(rng.uniform(-35, -30), 6),
+            "longitud": round(rng.uniform(-58, -53), 6),
+        }
+        for station_id in rng.sample(range(1, 500), rng.randint(1, 12))
+    ]
+    fechas = [f"2024-05-01 {hour:02d}:00" for hour in range(rng.randint(1, 6))]
+    variables = [{"idInt": index, "idStr": f"Var{index}"} for index in range(rng.randint(1, 5))]
+    observaciones = [
+        {
+            "idVar": _random_number(rng),
+            "datos": [
+                [rng.choice([_random_number(rng), None, "TRAZA"]) for _ in fechas]
+                for _ in stations
+            ],
+        }
+        for _ in variables
+    ]
+    return {
+        "fechas": fechas,
+        "extra": {"z": _random_number(rng), "lista": [1.5e3, -2, True, None]},
+        "estaciones": stations,
+        "variables": variables,
+        "observaciones": observaciones,
+    }
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_random_chunking_matches_json_loads(seed: int) -> None:
+    rng = random.Random(seed)
+    payload = _random_payload(rng)
+    station_ids = {station["id"] for station in payload["estaciones"] if rng.random() < 0.3}
+    body = json.dumps(payload, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 1])).encode()
+    sizes = [rng.randint(1, 64) for _ in range(len(body))]
+
+    assert _parse(body, station_ids, sizes) == _expected(payload, station_ids)
+
+
+@pytest.mark.parametrize(
+    "number", ["1.25", "-1.25", "1.25e10", "1.25E-10", "-0.5e+3", "12345", "-7"]
+)
+def test_number_split_at_every_position(number: str) -> None:
+    body = (
+        '{"z": %s, "estaciones": [{"id": 1}], "variables": [{"idStr": "A"}],'
+        ' "fechas": [], "observaciones": [{"idVar": %s, "datos": [[%s]]}]}' % ((number,) * 3)
+    ).encode()
+    expected = json.loads(body)
+    del expected["z"]
+    for split in range(1, len(body)):
+        assert _parse(body, {1}, [split]) == expected, split
+
+
+def test_byte_at_a_time_utf8() -> None:
+    payload = {"estaciones": [{"id": 3, "NombreEstacion": "Paysandú"}], "variables": [],
+               "fechas": [], "observaciones": []}
+    body = json.dumps(payload, ensure_ascii=False).encode()
+    assert _parse(body, {3}, [1] * len(body)) == payload
+
+
+def test_truncated_body_raises() -> None:
+    body = b'{"estaciones": [{"id": 1}], "observaciones": [{"datos": [[1.5'
+    with pytest.raises(ValueError):
+        _parse(body, {1}, [7] * len(body))